@@ -4,6 +4,7 @@ Test script to generate CSV output using mock data
 """
 
 import json
+from itertools import islice
 from scrape_autochek import AutochekScraper
 
 def test_csv_generation():
@@ -58,10 +59,8 @@ def test_csv_generation():
         print(f"✓ CSV file created successfully")
         with open(csv_file, 'r') as f:
             print("CSV content preview:")
-            for i, line in enumerate(f):
+            for line in islice(f, 3):  # Show first 3 lines
                 print(f"  {line.strip()}")
-                if i >= 2:  # Show first 3 lines
-                    break
     
     if os.path.exists(json_file):
         print(f"✓ JSON file created successfully")
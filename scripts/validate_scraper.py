@@ -7,15 +7,23 @@ import os
 import sys
 import json
 import csv
+import contextlib
+import importlib.util
+import io
+import pathlib
+import py_compile
 import subprocess
 import tempfile
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
 
 # Add src to Python path for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
 sys.path.insert(0, os.path.join(project_root, 'src'))
 
+# Directories not descended into when collecting project paths
+SKIP_DIRS = {'.git', '__pycache__', '.pytest_cache', 'venv', '.venv', 'node_modules'}
+
 
 class ScraperValidator:
     """Validator class for comprehensive scraper testing."""
@@ -25,7 +33,7 @@ class ScraperValidator:
         self.warnings = []
         self.passed_tests = 0
         self.total_tests = 0
-        self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.project_root = pathlib.Path(__file__).resolve().parent.parent
     
     def log_error(self, message: str) -> None:
         """Log an error message."""
@@ -42,43 +50,58 @@ class ScraperValidator:
         self.passed_tests += 1
         print(f"✅ PASS: {message}")
     
-    def test_file_exists(self, filepath: str, description: str) -> bool:
-        """Test if a file exists."""
+    def test_file_exists(self, filepath: str, description: str, known_paths: Optional[Set[str]] = None) -> bool:
+        """Test if a file exists, using a pre-collected path set when given."""
         self.total_tests += 1
-        full_path = os.path.join(self.project_root, filepath)
-        if os.path.exists(full_path):
+        if known_paths is not None:
+            exists = filepath in known_paths
+        else:
+            exists = (self.project_root / filepath).exists()
+        
+        if exists:
             self.log_success(f"{description} exists")
             return True
         else:
             self.log_error(f"{description} not found: {filepath}")
             return False
     
+    def _collect_paths(self, root: pathlib.Path, max_depth: int = 3) -> Set[str]:
+        """Walk ``root`` once with os.scandir and return relative paths up to ``max_depth`` levels."""
+        paths = set()
+        pending = [(root, '', 1)]
+        
+        while pending:
+            directory, prefix, depth = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative = prefix + entry.name
+                    paths.add(relative)
+                    if depth < max_depth and entry.name not in SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, relative + '/', depth + 1))
+        
+        return paths
+    
     def test_dependencies(self) -> None:
         """Test that all required dependencies are installed."""
-        required_packages = [
-            'requests', 'beautifulsoup4', 'lxml', 'playwright', 
-            'python-dotenv', 'pytest'
-        ]
+        # Distribution name -> import name
+        required_packages = {
+            'requests': 'requests',
+            'beautifulsoup4': 'bs4',
+            'lxml': 'lxml',
+            'playwright': 'playwright',
+            'python-dotenv': 'dotenv',
+            'pytest': 'pytest',
+            'pytest-xdist': 'xdist'
+        }
         
         print("\n📦 Testing dependencies...")
-        for package in required_packages:
+        for package, module_name in required_packages.items():
             self.total_tests += 1
-            try:
-                __import__(package.replace('-', '_'))
+            # find_spec locates the package without executing its module code
+            if importlib.util.find_spec(module_name) is not None:
                 self.log_success(f"Package {package} is installed")
-            except ImportError:
-                try:
-                    # Handle packages with different import names
-                    if package == 'beautifulsoup4':
-                        import bs4
-                        self.log_success(f"Package {package} is installed")
-                    elif package == 'python-dotenv':
-                        import dotenv
-                        self.log_success(f"Package {package} is installed")
-                    else:
-                        raise ImportError
-                except ImportError:
-                    self.log_error(f"Package {package} is not installed")
+            else:
+                self.log_error(f"Package {package} is not installed")
     
     def test_code_syntax(self) -> None:
         """Test Python syntax for main files."""
@@ -93,17 +116,13 @@ class ScraperValidator:
         print("\n🐍 Testing Python syntax...")
         for filename in python_files:
             self.total_tests += 1
-            full_path = os.path.join(self.project_root, filename)
-            if os.path.exists(full_path):
+            full_path = self.project_root / filename
+            if full_path.exists():
                 try:
-                    result = subprocess.run(
-                        [sys.executable, '-m', 'py_compile', full_path],
-                        capture_output=True, text=True
-                    )
-                    if result.returncode == 0:
-                        self.log_success(f"Syntax valid for {filename}")
-                    else:
-                        self.log_error(f"Syntax error in {filename}: {result.stderr}")
+                    py_compile.compile(full_path, doraise=True)
+                    self.log_success(f"Syntax valid for {filename}")
+                except py_compile.PyCompileError as e:
+                    self.log_error(f"Syntax error in {filename}: {e.msg}")
                 except Exception as e:
                     self.log_error(f"Failed to check syntax for {filename}: {e}")
             else:
@@ -115,24 +134,26 @@ class ScraperValidator:
         self.total_tests += 1
         
         try:
+            import pytest
+            
             # Change to project root for test execution
             original_cwd = os.getcwd()
             os.chdir(self.project_root)
             
-            result = subprocess.run(
-                [sys.executable, '-m', 'pytest', 'tests/test_scraper.py', '-v'],
-                capture_output=True, text=True
-            )
-            
-            # Restore original working directory
-            os.chdir(original_cwd)
+            # Run pytest in this interpreter, keeping its output for diagnostics;
+            # xdist is disabled so no worker interpreters are started
+            output = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(output):
+                    result = pytest.main(['tests/test_scraper.py', '-q', '-p', 'no:xdist'])
+            finally:
+                # Restore original working directory
+                os.chdir(original_cwd)
             
-            if result.returncode == 0:
+            if result == 0:
                 self.log_success("All unit tests passed")
             else:
-                self.log_error(f"Unit tests failed: {result.stdout}")
-                if result.stderr:
-                    self.log_error(f"Error output: {result.stderr}")
+                self.log_error(f"Unit tests failed: {output.getvalue()}")
         except Exception as e:
             self.log_error(f"Failed to run unit tests: {e}")
     
@@ -233,7 +254,7 @@ class ScraperValidator:
             scraper.save_to_json(mock_data, json_file)
             
             # Verify JSON file
-            with open(json_file, 'r') as f:
+            with open(json_file, 'r', encoding='utf-8') as f:
                 loaded_data = json.load(f)
                 if loaded_data == mock_data:
                     self.log_success("JSON output format working correctly")
@@ -272,7 +293,7 @@ class ScraperValidator:
         """Test command line interface."""
         print("\n💻 Testing command line interface...")
         
-        script_path = os.path.join(self.project_root, 'scrape_autochek.py')
+        script_path = self.project_root / 'scrape_autochek.py'
         
         # Test help command
         self.total_tests += 1
@@ -345,8 +366,11 @@ class ScraperValidator:
             ('docs', 'Documentation directory')
         ]
         
+        # One directory walk instead of a stat call per entry
+        known_paths = self._collect_paths(self.project_root)
+        
         for dir_path, description in directories:
-            self.test_file_exists(dir_path, description)
+            self.test_file_exists(dir_path, description, known_paths)
         
         # Test main files
         files_to_check = [
@@ -366,7 +390,7 @@ class ScraperValidator:
         ]
         
         for filepath, description in files_to_check:
-            self.test_file_exists(filepath, description)
+            self.test_file_exists(filepath, description, known_paths)
     
     def run_all_tests(self) -> None:
         """Run all validation tests."""
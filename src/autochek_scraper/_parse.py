@@ -0,0 +1,127 @@
+"""
+Listing records and the text parsing that fills them in.
+
+Kept free of I/O and fully annotated so the module can be compiled with
+mypyc (``mypyc src/autochek_scraper/_parse.py``); the pure-Python module is
+used as-is when no compiled build is present.
+"""
+
+import re
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+# First run of digits and thousands separators in a price or mileage
+_NUM_RE = re.compile(r'[\d,]+')
+
+# Currency markers, checked in order; the first one present wins
+CURRENCIES = ('NGN', 'N', '₦', 'USD', '$')
+
+# Plausible model years in listing titles
+MIN_YEAR = 1980
+MAX_YEAR = 2030
+
+
+@dataclass(slots=True)
+class Vehicle:
+    """A single listing, stored in slots rather than a per-record dict."""
+    listing_id: Optional[str] = None
+    make: Optional[str] = None
+    model: Optional[str] = None
+    year: Optional[int] = None
+    variant: Optional[str] = None
+    price: Optional[int] = None
+    currency: Optional[str] = None
+    mileage: Optional[int] = None
+    location: Optional[str] = None
+    listing_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    created_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the listing as a plain dict, in field order."""
+        return dict(zip(VEHICLE_FIELDS, _VEHICLE_GETTER(self)))
+
+
+VEHICLE_FIELDS = tuple(field.name for field in fields(Vehicle))
+_VEHICLE_GETTER = attrgetter(*VEHICLE_FIELDS)
+
+
+@lru_cache(maxsize=4096)
+def parse_title(title: str) -> Tuple[Optional[str], Optional[str], Optional[int], Optional[str]]:
+    """Split a listing title into (make, model, year, variant); titles repeat across pages."""
+    parts = title.split()
+    if not parts:
+        return None, None, None, None
+
+    # First plausible 4-digit model year, if any
+    year_index = -1
+    for i, part in enumerate(parts):
+        # isdigit() alone also accepts digits int() rejects, such as superscripts
+        if len(part) == 4 and part.isascii() and part.isdigit() and MIN_YEAR <= int(part) <= MAX_YEAR:
+            year_index = i
+            break
+    year = int(parts[year_index]) if year_index >= 0 else None
+
+    # "YEAR MAKE MODEL ..." puts everything after the model in the variant
+    if year_index == 0 and len(parts) >= 3:
+        return parts[1], parts[2], year, ' '.join(parts[3:]) or None
+    if len(parts) < 2:
+        return None, None, year, None
+
+    # "MAKE MODEL [VARIANT] [YEAR] [VARIANT]"
+    variant_parts: List[str] = []
+    if year_index > 1:
+        variant_parts = parts[2:year_index] + parts[year_index + 1:]
+    elif year_index < 0:
+        variant_parts = parts[2:]
+    return parts[0], parts[1], year, ' '.join(variant_parts) or None
+
+
+def parse_autochek_title(title: str, vehicle: Vehicle) -> None:
+    """Set make, model, year and variant on the vehicle from an Autochek title."""
+    make, model, year, variant = parse_title(title.strip())
+    if make is not None:
+        vehicle.make = make
+    if model is not None:
+        vehicle.model = model
+    if year is not None:
+        vehicle.year = year
+    if variant is not None:
+        vehicle.variant = variant
+
+
+def parse_price(price_text: str, vehicle: Vehicle) -> None:
+    """Set price and currency on the vehicle from price text."""
+    number = _NUM_RE.search(price_text)
+    if number:
+        try:
+            vehicle.price = int(number.group().replace(',', ''))
+        except ValueError:
+            pass
+
+    for currency in CURRENCIES:
+        if currency in price_text:
+            vehicle.currency = currency
+            break
+
+    if not vehicle.currency:
+        vehicle.currency = 'NGN'  # Default for Nigeria
+
+
+def parse_mileage(mileage_text: str, vehicle: Vehicle) -> None:
+    """Set mileage on the vehicle from mileage text."""
+    number = _NUM_RE.search(mileage_text)
+    if number:
+        try:
+            vehicle.mileage = int(number.group().replace(',', ''))
+        except ValueError:
+            pass
+
+
+def is_valid_vehicle_data(vehicle: Vehicle) -> bool:
+    """Check the vehicle has a make or model plus at least one identifying field."""
+    # Must have at least make or model, and some other identifying information
+    return bool((vehicle.make or vehicle.model)
+                and (vehicle.listing_id or vehicle.listing_url or vehicle.price or vehicle.year))
@@ -3,21 +3,59 @@ Command-line interface for the Autochek Africa vehicle scraper.
 """
 
 import argparse
+import json
 import logging
+import os
 import sys
-from .scraper import AutochekScraper
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+from .scraper import AutochekScraper, PYARROW_AVAILABLE
+from .retry_utils import stop_retries
+
+
+# Output file extension -> format name
+OUTPUT_FORMATS = {
+    '.json': 'json',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.feather': 'feather'
+}
+
+FORMAT_LABELS = {
+    'json': 'JSON',
+    'ndjson': 'NDJSON',
+    'csv': 'CSV',
+    'parquet': 'Parquet',
+    'feather': 'Feather'
+}
+
+# Formats written through pyarrow, an optional dependency
+ARROW_FORMATS = ('parquet', 'feather')
 
 
 def setup_logging(level: str = "INFO") -> None:
     """Setup logging configuration."""
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
+    level = level.upper()
+    
+    # Timestamps are only formatted for DEBUG runs; other levels skip the time lookup per record
+    if level == 'DEBUG':
+        fmt = '{asctime} - {levelname} - {message}'
+    else:
+        fmt = '{levelname} - {message}'
+    
+    # Skip collecting record fields the format never uses
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(fmt, style='{'))
+    logging.basicConfig(level=getattr(logging, level), handlers=[handler])
 
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command line arguments."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(
         description='Scrape vehicle listings from Autochek Africa',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -29,20 +67,26 @@ Examples:
   # CSV output
   %(prog)s --make "Toyota" --model "Corolla" --year 2015 --out results.csv
   
+  # Parquet output (requires pyarrow)
+  %(prog)s --make "Toyota" --model "Corolla" --year 2015 --out results.parquet
+  
   # Both formats
   %(prog)s --make "Honda" --model "Civic" --year 2018 --out results.json --csv results.csv
+  
+  # Daemon mode: one JSON job per line on stdin
+  echo '{"make": "Toyota", "model": "Corolla", "year": 2015, "out": "a.json"}' | %(prog)s --daemon
         """
     )
     
-    # Required arguments
-    parser.add_argument('--make', required=True, 
+    # Required arguments (not needed in daemon mode)
+    parser.add_argument('--make', 
                        help='Vehicle make (e.g., Toyota)')
-    parser.add_argument('--model', required=True, 
+    parser.add_argument('--model', 
                        help='Vehicle model (e.g., Corolla)')
-    parser.add_argument('--year', required=True, type=int, 
+    parser.add_argument('--year', type=int, 
                        help='Vehicle year (e.g., 2015)')
-    parser.add_argument('--out', required=True, 
-                       help='Output file path (.json or .csv)')
+    parser.add_argument('--out', 
+                       help='Output file path (.json, .ndjson, .csv, .parquet or .feather)')
     
     # Optional arguments
     parser.add_argument('--csv', 
@@ -57,44 +101,157 @@ Examples:
                        help='Maximum number of HTTP retry attempts on 5xx errors (default: 3)')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        default='INFO', help='Logging level (default: INFO)')
+    parser.add_argument('--daemon', action='store_true',
+                       help='Read JSON job lines ({"make", "model", "year", "out"}) from stdin '
+                            'and run them with one long-lived scraper')
+    
+    return parser
+
+
+# Built once at import so repeated parses reuse it
+_PARSER = build_parser()
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    args = _PARSER.parse_args(argv)
+    
+    if not args.daemon:
+        missing = [f"--{name}" for name in ('make', 'model', 'year', 'out') if getattr(args, name) is None]
+        if missing:
+            _PARSER.error(f"the following arguments are required: {', '.join(missing)}")
     
-    return parser.parse_args()
+    return args
+
+
+def get_output_format(path: str) -> Optional[str]:
+    """Return the output format for ``path`` from its extension, or None if unsupported."""
+    return OUTPUT_FORMATS.get(os.path.splitext(path)[1].lower())
+
+
+def output_path_error(path: str) -> Optional[str]:
+    """Return why ``path`` cannot be written as output, or None if it can."""
+    output_format = get_output_format(path)
+    if output_format is None:
+        return f"unsupported output format for {path} (expected one of: {', '.join(OUTPUT_FORMATS)})"
+    if output_format in ARROW_FORMATS and not PYARROW_AVAILABLE:
+        return f"{FORMAT_LABELS[output_format]} output for {path} requires pyarrow (pip install pyarrow)"
+    return None
+
+
+def _validate_output_path(path: str) -> None:
+    """Exit with status 2 before any scraping if ``path`` cannot be written."""
+    error = output_path_error(path)
+    if error:
+        _PARSER.error(f"--out: {error}")
+
+
+def get_output_targets(args: argparse.Namespace) -> Dict[str, Tuple[str, str]]:
+    """
+    Map each unique output file to its format.
+    
+    Returns a dict of absolute path -> (format, path as given), so a file
+    named by both --out and --csv is only written once. Raises ValueError
+    for an output that cannot be written, before any scraping happens.
+    """
+    targets = {}
+    if args.csv:
+        targets[os.path.abspath(args.csv)] = ('csv', args.csv)
+    
+    error = output_path_error(args.out)
+    if error:
+        raise ValueError(error)
+    targets[os.path.abspath(args.out)] = (get_output_format(args.out), args.out)
+    
+    return targets
+
+
+def save_results(scraper: AutochekScraper, vehicles: List[Dict[str, Any]],
+                 targets: Dict[str, Tuple[str, str]]) -> List[str]:
+    """Write results to every requested output file and describe what was saved."""
+    writers = {
+        'json': scraper.save_to_json,
+        'ndjson': scraper.save_to_ndjson,
+        'csv': scraper.save_to_csv,
+        'parquet': scraper.save_to_parquet,
+        'feather': scraper.save_to_feather
+    }
+    saved_files = []
+    for output_format, path in targets.values():
+        writers[output_format](vehicles, path)
+        saved_files.append(f"{FORMAT_LABELS[output_format]}: {path}")
+    return saved_files
+
+
+def run_daemon(scraper: AutochekScraper, stream: TextIO) -> int:
+    """
+    Run scrape jobs read as JSON lines from ``stream`` with a single scraper.
+    
+    Each line is {"make", "model", "year", "out"} with an optional "csv".
+    One JSON status line is printed per job.
+    """
+    logger = logging.getLogger(__name__)
+    
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            job = json.loads(line)
+            # Resolve outputs first so a bad path fails before scraping
+            targets = get_output_targets(argparse.Namespace(out=job['out'], csv=job.get('csv')))
+            
+            logger.info(f"Starting job for {job['make']} {job['model']} {job['year']}")
+            vehicles = scraper.search_vehicles(job['make'], job['model'], int(job['year']))
+            saved_files = save_results(scraper, vehicles, targets)
+            
+            status = {'status': 'ok', 'count': len(vehicles), 'saved': saved_files}
+        except Exception as e:
+            logger.error(f"Job failed: {e}")
+            status = {'status': 'error', 'error': str(e)}
+        
+        print(json.dumps(status, ensure_ascii=False), flush=True)
+    
+    return 0
 
 
 def main() -> int:
     """Main entry point for the scraper."""
     try:
         args = parse_arguments()
+        if not args.daemon:
+            _validate_output_path(args.out)
         
         # Setup logging
         setup_logging(args.log_level)
         logger = logging.getLogger(__name__)
         
-        logger.info(f"Starting Autochek scraper for {args.make} {args.model} {args.year}")
-        
         # Initialize scraper
         scraper = AutochekScraper(rate_limit=args.rate_limit, headless=args.headless, max_retries=args.max_retries)
         
-        # Perform search
-        vehicles = scraper.search_vehicles(args.make, args.model, args.year)
-        
-        if not vehicles:
-            logger.warning("No vehicles found matching the criteria")
-        
-        # Save results
-        saved_files = []
-        
-        # Determine output format from file extension or --csv flag
-        if args.csv:
-            scraper.save_to_csv(vehicles, args.csv)
-            saved_files.append(f"CSV: {args.csv}")
+        try:
+            if args.daemon:
+                logger.info("Running in daemon mode, reading jobs from stdin")
+                return run_daemon(scraper, sys.stdin)
+            
+            logger.info(f"Starting Autochek scraper for {args.make} {args.model} {args.year}")
+            
+            # Perform search
+            vehicles = scraper.search_vehicles(args.make, args.model, args.year)
+            
+            if not vehicles:
+                logger.warning("No vehicles found matching the criteria")
             
-        if args.out.lower().endswith('.csv'):
-            scraper.save_to_csv(vehicles, args.out)
-            saved_files.append(f"CSV: {args.out}")
-        else:
-            scraper.save_to_json(vehicles, args.out)
-            saved_files.append(f"JSON: {args.out}")
+            # Save results, writing each unique output file exactly once
+            saved_files = save_results(scraper, vehicles, get_output_targets(args))
+        except KeyboardInterrupt:
+            # Stop retries before close() so shutdown never waits on a backoff
+            stop_retries()
+            raise
+        finally:
+            # Shut down the browser shared by the searches
+            scraper.close()
         
         # Print summary
         print(f"\n✅ Successfully scraped {len(vehicles)} vehicles")
@@ -112,6 +269,8 @@ def main() -> int:
         return 0
         
     except KeyboardInterrupt:
+        # Wake any worker threads sleeping in a retry backoff
+        stop_retries()
         print("\n⚠️  Scraping interrupted by user")
         return 130
         
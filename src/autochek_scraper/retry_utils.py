@@ -2,15 +2,115 @@
 Retry utilities for handling HTTP errors and network failures.
 """
 
-import time
 import logging
-from typing import Callable, Any, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Any, Dict, Iterable, List, Optional, Tuple
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception, retry_if_exception_type
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared sessions: number of per-host pools
+# cached, and connections kept alive per host (sized above MAX_WORKERS so
+# concurrent fetches never drop connections)
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Default number of concurrent requests for batch fetches
+MAX_WORKERS = 8
+
+# Status codes that urllib3 retries with exponential backoff (429 honours Retry-After)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Advertise brotli only when a decoder is installed, otherwise urllib3 could not inflate it
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, br, deflate'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+_SESSIONS: Dict[Tuple[int, float], requests.Session] = {}
+
+
+# Process-wide: set to cut short every pending retry backoff (e.g. on Ctrl-C).
+# The pooled adapters are shared between sessions, so this cannot be scoped
+# to one session; it stays set until reset_retries() is called.
+_STOP_EVENT = threading.Event()
+
+
+def stop_retries() -> None:
+    """Interrupt in-progress retry backoffs in all threads and stop further retries, process-wide."""
+    _STOP_EVENT.set()
+
+
+def reset_retries() -> None:
+    """Re-enable retries for every session after stop_retries()."""
+    _STOP_EVENT.clear()
+
+
+class InterruptibleRetry(Retry):
+    """Retry policy whose backoff waits return early once retries are stopped."""
+    
+    def sleep_for_retry(self, response) -> bool:
+        retry_after = self.get_retry_after(response)
+        if retry_after:
+            self._wait(retry_after)
+            return True
+        return False
+    
+    def _sleep_backoff(self) -> None:
+        backoff = self.get_backoff_time()
+        if backoff > 0:
+            self._wait(backoff)
+    
+    def _wait(self, seconds: float) -> None:
+        if _STOP_EVENT.wait(seconds):
+            raise HTTPRetryError("Retry backoff interrupted")
+
+
+def build_retry(max_retries: int = 3, backoff_factor: float = 1.0) -> Retry:
+    """Build the urllib3 retry policy used by the pooled adapters."""
+    return InterruptibleRetry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'POST']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+
+def get_shared_session(max_retries: int = 3, backoff_factor: float = 1.0) -> requests.Session:
+    """
+    Return the process-wide pooled session for a retry policy, creating it on first use.
+    
+    All scraper instances with the same retry settings share one session so
+    TCP/TLS connections to the same host are kept alive and reused.
+    """
+    key = (max_retries, backoff_factor)
+    session = _SESSIONS.get(key)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=build_retry(max_retries, backoff_factor)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+        _SESSIONS[key] = session
+    return session
+
 
 class HTTPRetryError(Exception):
     """Custom exception for HTTP retry failures."""
@@ -19,7 +119,7 @@ class HTTPRetryError(Exception):
 
 def is_5xx_error(exception):
     """Check if exception is a 5xx HTTP error."""
-    if isinstance(exception, requests.HTTPError):
+    if isinstance(exception, requests.HTTPError) and exception.response is not None:
         return exception.response.status_code >= 500
     return False
 
@@ -36,64 +136,93 @@ def retry_on_5xx(max_attempts: int = 3, min_wait: float = 1.0, max_wait: float =
     return retry(
         stop=stop_after_attempt(max_attempts),
         wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
-        retry=retry_if_exception_type(requests.HTTPError) & retry_if_exception_type(requests.RequestException),
+        # Only transient failures are retried; 4xx errors fail fast
+        retry=(retry_if_exception(is_5xx_error)
+               | retry_if_exception_type((requests.ConnectionError, requests.Timeout))),
         reraise=True
     )
 
 
+class RateLimiter:
+    """Thread-safe limiter that spaces calls at least ``interval`` seconds apart."""
+    
+    def __init__(self, interval: float = 0.0):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_ok = 0.0
+    
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        if self.interval <= 0:
+            return
+        
+        # Reserve a slot under the lock, sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_ok - now
+            self._next_ok = max(now, self._next_ok) + self.interval
+        
+        if delay > 0:
+            time.sleep(delay)
+
+
 class RetryableHTTPSession:
     """HTTP session with built-in 5xx retry logic."""
     
-    def __init__(self, max_retries: int = 3, backoff_factor: float = 1.0):
-        self.session = requests.Session()
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 1.0,
+                 session: Optional[requests.Session] = None, rate_limit: float = 0.0):
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.session = session if session is not None else get_shared_session(max_retries, backoff_factor)
+        self.rate_limiter = RateLimiter(rate_limit)
         
     def get(self, url: str, **kwargs) -> requests.Response:
         """GET request with retry logic."""
-        return self._request_with_retry('GET', url, **kwargs)
+        return self._request('GET', url, **kwargs)
     
     def post(self, url: str, **kwargs) -> requests.Response:
         """POST request with retry logic."""
-        return self._request_with_retry('POST', url, **kwargs)
+        return self._request('POST', url, **kwargs)
     
-    def _request_with_retry(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Execute HTTP request with retry logic on 5xx errors."""
-        last_exception = None
+    def fetch_many(self, urls: Iterable[str], max_workers: int = MAX_WORKERS,
+                   return_exceptions: bool = False, **kwargs) -> List[Any]:
+        """
+        GET several URLs concurrently over the pooled connections.
         
-        for attempt in range(1, self.max_retries + 1):
+        Each worker retries independently; the session rate limit is shared
+        across workers. Responses are returned in the order of ``urls``. With
+        ``return_exceptions`` a URL that fails yields its exception in place of
+        a response instead of aborting the whole batch.
+        """
+        def fetch(url: str) -> Any:
             try:
-                response = self.session.request(method, url, **kwargs)
-                
-                # Check for 5xx errors
-                if response.status_code >= 500:
-                    logger.warning(
-                        f"HTTP {response.status_code} error on attempt {attempt}/{self.max_retries} "
-                        f"for {method} {url}"
-                    )
-                    
-                    if attempt < self.max_retries:
-                        wait_time = self.backoff_factor * (2 ** (attempt - 1))
-                        logger.info(f"Retrying in {wait_time:.1f} seconds...")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        response.raise_for_status()
-                
-                # Success or 4xx error (don't retry)
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                logger.error(f"Request failed on attempt {attempt}/{self.max_retries}: {e}")
-                
-                if attempt < self.max_retries:
-                    wait_time = self.backoff_factor * (2 ** (attempt - 1))
-                    logger.info(f"Retrying in {wait_time:.1f} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    raise HTTPRetryError(f"Max retries ({self.max_retries}) exceeded") from e
+                return self.get(url, **kwargs)
+            except (requests.RequestException, HTTPRetryError) as e:
+                if not return_exceptions:
+                    raise
+                return e
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, urls))
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Execute HTTP request; retries and backoff are handled by the adapter.
+        
+        Raises HTTPError if the server still answers 5xx once retries are
+        exhausted, and HTTPRetryError if the request never succeeded.
+        """
+        self.rate_limiter.wait()
+        
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            logger.error(f"Request failed for {method} {url}: {e}")
+            raise HTTPRetryError(f"Max retries ({self.max_retries}) exceeded") from e
+        
+        # Success or 4xx error (not retried)
+        if response.status_code >= 500:
+            logger.warning(f"HTTP {response.status_code} error after {self.max_retries} retries for {method} {url}")
+            response.raise_for_status()
         
-        # This should never be reached, but just in case
-        if last_exception:
-            raise last_exception
\ No newline at end of file
+        return response
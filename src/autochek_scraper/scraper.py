@@ -2,16 +2,298 @@
 Core scraper functionality for Autochek Africa vehicle listings.
 """
 
+import asyncio
 import logging
-import time
 import csv
+import io
 import json
-from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin
+import re
+import time
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Set
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 import requests
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-from .retry_utils import RetryableHTTPSession, retry_on_5xx
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from ._parse import Vehicle, is_valid_vehicle_data, parse_autochek_title, parse_mileage, parse_price
+from .retry_utils import RetryableHTTPSession
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    LexborHTMLParser = None
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pyarrow = None
+    PYARROW_AVAILABLE = False
+
+
+# Column order for CSV output
+CSV_FIELDNAMES = [
+    'listing_id', 'make', 'model', 'year', 'variant', 
+    'price', 'currency', 'mileage', 'location', 
+    'listing_url', 'thumbnail_url', 'created_at'
+]
+
+# Pulls a row's values in column order with a single call
+_CSV_ROW_GETTER = itemgetter(*CSV_FIELDNAMES)
+
+CSV_LINE_TERMINATOR = '\r\n'
+CSV_BUFFER_SIZE = 1 << 20
+CSV_BLOCK_ROWS = 10000
+
+# Characters that force a field to be quoted
+_CSV_QUOTE_RE = re.compile(r'[,"\r\n]')
+
+# Pagination limits - MAX_PAGES kept low for testing, can be increased later
+MAX_PAGES = 6
+MAX_PARALLEL_PAGES = 3
+
+# Navigation timeout for result pages, and how long to wait for listings to render (ms)
+PAGE_TIMEOUT = 15000
+LISTINGS_TIMEOUT = 10000
+
+# Window size for the shared browser context
+BROWSER_VIEWPORT = {'width': 1280, 'height': 800}
+
+# Links to individual car pages; present once the listings grid has rendered
+LISTING_LINK_SELECTOR = 'a[href*="/ng/car/"]'
+
+# Per-field selectors within a listing card.
+# Field selectors are tried in order; the first usable match wins.
+_TITLE_SELECTORS = (
+    'h6.MuiTypography-root.MuiTypography-h6.css-1g399u0',
+    'h6.MuiTypography-h6',
+    'h6[class*="MuiTypography"]',
+    'h6',
+    '[class*="Typography"] h6'
+)
+
+_PRICE_SELECTORS = (
+    'p.MuiTypography-root.MuiTypography-body1.css-1bztvjj',
+    'p.MuiTypography-body1',
+    'p[class*="MuiTypography"]',
+    'p[class*="price"]',
+    '[class*="price"]',
+    'p'
+)
+
+_LOCATION_SELECTORS = (
+    'span.MuiTypography-root.MuiTypography-caption.css-umr6w4',
+    'span.MuiTypography-caption',
+    'span[class*="MuiTypography-caption"]',
+    'span[class*="caption"]',
+    '[class*="location"]'
+)
+
+_IMG_SELECTORS = (
+    'img[src*="http"]',
+    'img',
+    '[style*="background-image"]'
+)
+
+_DATE_SELECTORS = (
+    'time',
+    '[datetime]',
+    '[class*="date"]',
+    '[class*="time"]',
+    'span[title]',
+    'div[title]'
+)
+
+
+# Text patterns used while extracting card fields
+_BG_URL_RE = re.compile(r'url\(["\']?([^"\']+)["\']?\)')
+_MONTHS_SET = frozenset((
+    'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Sept', 'Oct', 'Nov', 'Dec',
+    'January', 'February', 'March', 'April', 'June', 'July', 'August', 'September',
+    'October', 'November', 'December'
+))
+
+# Applied once to a card's flattened text; the selector sweeps are only a fallback
+_PRICE_RE = re.compile(r'(?:₦|NGN|USD|\$)\s*[\d,]+')
+_MILEAGE_RE = re.compile(r'[\d,]+\s*(?:km|miles?)\b', re.IGNORECASE)
+
+NIGERIAN_CITIES = (
+    'Lagos', 'Abuja', 'Kano', 'Ibadan', 'Port Harcourt', 'Benin', 'Jos', 'Ilorin', 'Kaduna', 'Oyo',
+    'Enugu', 'Abeokuta', 'Zaria', 'Aba', 'Maiduguri', 'Warri', 'Ebute Ikorodu', 'Sokoto', 'Onitsha',
+    'Calabar', 'Uyo', 'Katsina', 'Ado Ekiti', 'Gombe', 'Minna', 'Effon Alaiye', 'Ikeja',
+    'Victoria Island', 'Lekki', 'Yaba', 'Surulere'
+)
+_CITY_RE = re.compile(r'\b(?:' + '|'.join(re.escape(city) for city in NIGERIAN_CITIES) + r')\b', re.IGNORECASE)
+
+def _mentions_month(text: str) -> bool:
+    """Whether any word of the text is a month name, e.g. '15 Jan, 2024'."""
+    return not _MONTHS_SET.isdisjoint(text.replace(',', ' ').replace('.', ' ').split())
+
+
+# Runs in the page and returns every card's raw fields in one round-trip.
+# Each field lists the first match of every selector, in selector order,
+# so the fallbacks are still decided on the Python side.
+_CARD_FIELDS_JS = """
+(sel) => {
+    const firstText = (card, selectors) => selectors.map(s => {
+        const el = card.querySelector(s);
+        return el ? el.textContent : null;
+    });
+    const allText = (card) => {
+        const texts = [];
+        const walker = document.createTreeWalker(card, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) texts.push(walker.currentNode.nodeValue);
+        return texts.join(' ');
+    };
+    return Array.from(document.querySelectorAll(sel.card), card => ({
+        href: card.getAttribute('href'),
+        text: allText(card),
+        title: firstText(card, sel.title),
+        price: firstText(card, sel.price),
+        location: firstText(card, sel.location),
+        img: sel.img.map(s => {
+            const el = card.querySelector(s);
+            return el ? {src: el.getAttribute('src'), style: el.getAttribute('style')} : null;
+        }),
+        date: sel.date.map(s => Array.from(card.querySelectorAll(s), el => ({
+            datetime: el.getAttribute('datetime'), title: el.getAttribute('title'), text: el.textContent
+        })))
+    }));
+}
+"""
+_CARD_FIELD_SELECTORS = {
+    'card': LISTING_LINK_SELECTOR,
+    'title': _TITLE_SELECTORS,
+    'price': _PRICE_SELECTORS,
+    'location': _LOCATION_SELECTORS,
+    'img': _IMG_SELECTORS,
+    'date': _DATE_SELECTORS
+}
+
+
+# Backend JSON endpoints worth probing for listings
+SITE_DOMAIN = 'autochek.africa'
+_API_URL_RE = re.compile(r'/api/|//api\.|/_next/data/')
+
+# Keys that commonly hold the record list in an API payload
+_API_RECORD_KEYS = ('result', 'results', 'data', 'items', 'cars', 'listings')
+
+# Requests the scraper never reads: thumbnails come from the src attribute,
+# so images, fonts, styles and third-party trackers are aborted in the browser
+BLOCKED_RESOURCE_TYPES = frozenset(('image', 'media', 'font', 'stylesheet'))
+BLOCKED_HOSTS = ('google-analytics', 'googletagmanager', 'facebook.net', 'segment.io', 'hotjar')
+
+# Compression codec for Parquet/Feather output
+ARROW_COMPRESSION = 'zstd'
+
+
+@lru_cache(maxsize=1024)
+def build_listings_url(base_url: str, page_num: int = 1) -> str:
+    """Build the cars-for-sale URL for a results page."""
+    listings_url = f"{base_url}/ng/cars-for-sale"
+    if page_num == 1:
+        return listings_url
+    return f"{listings_url}?page_number={page_num}"
+
+
+def with_page_number(url: str, page_num: int) -> str:
+    """Return ``url`` with its page_number query parameter set to ``page_num``."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query['page_number'] = str(page_num)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(vehicles: List[Dict[str, Any]]) -> bytes:
+    """Serialize vehicles to indented UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(vehicles, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(vehicles, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def _node_text(node) -> Optional[str]:
+    """Text of a selectolax node, or None when the selector matched nothing."""
+    return None if node is None else node.text()
+
+
+def _card_fields(card) -> Dict[str, Any]:
+    """Collect a selectolax card node's raw fields in the shape _CARD_FIELDS_JS returns."""
+    images = []
+    for selector in _IMG_SELECTORS:
+        node = card.css_first(selector)
+        images.append(None if node is None else {'src': node.attributes.get('src'),
+                                                 'style': node.attributes.get('style')})
+    return {
+        'href': card.attributes.get('href'),
+        'text': card.text(separator=' '),
+        'title': [_node_text(card.css_first(selector)) for selector in _TITLE_SELECTORS],
+        'price': [_node_text(card.css_first(selector)) for selector in _PRICE_SELECTORS],
+        'location': [_node_text(card.css_first(selector)) for selector in _LOCATION_SELECTORS],
+        'img': images,
+        'date': [[{'datetime': node.attributes.get('datetime'), 'title': node.attributes.get('title'),
+                   'text': node.text()} for node in card.css(selector)] for selector in _DATE_SELECTORS]
+    }
+
+
+def _new_listings(vehicles: List[Vehicle], seen: Set[str]) -> List[Vehicle]:
+    """Drop listings already in ``seen`` (keyed by listing_id, else listing_url) and record the rest."""
+    fresh = []
+    for vehicle in vehicles:
+        key = vehicle.listing_id or vehicle.listing_url
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        fresh.append(vehicle)
+    return fresh
+
+
+def iter_ndjson(vehicles: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Yield one newline-terminated UTF-8 JSON line per vehicle."""
+    if ORJSON_AVAILABLE:
+        for vehicle in vehicles:
+            yield orjson.dumps(vehicle, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        for vehicle in vehicles:
+            yield (json.dumps(vehicle, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def _arrow_schema():
+    """Build the columnar schema; low-cardinality text columns are dictionary encoded."""
+    category = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+    return pyarrow.schema([
+        ('listing_id', pyarrow.string()),
+        ('make', category),
+        ('model', category),
+        ('year', pyarrow.int32()),
+        ('variant', pyarrow.string()),
+        ('price', pyarrow.int64()),
+        ('currency', category),
+        ('mileage', pyarrow.int64()),
+        ('location', category),
+        ('listing_url', pyarrow.string()),
+        ('thumbnail_url', pyarrow.string()),
+        ('created_at', pyarrow.string())
+    ])
 
 
 class AutochekScraper:
@@ -32,18 +314,52 @@ class AutochekScraper:
         self.base_url = "https://autochek.africa"
         
         # Use retryable session instead of regular session
-        self.session = RetryableHTTPSession(max_retries=max_retries)
+        self.session = RetryableHTTPSession(max_retries=max_retries, rate_limit=rate_limit)
         self.session.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
         
         # Setup logging
         self.logger = logging.getLogger(__name__)
+        
+        # Earliest time the next browser request may go to each host
+        self._next_request_at: Dict[str, float] = {}
+        
+        # Browser state shared by every search; started lazily by _ensure_browser
+        self._loop = None
+        self._playwright = None
+        self._browser = None
+        self._context = None
+    
+    def __enter__(self) -> 'AutochekScraper':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the shared browser and the event loop searches run on."""
+        if self._loop is None:
+            return
+        try:
+            # A search interrupted by Ctrl-C is still pending; cancel it so it
+            # cannot resume (and fall back to scraping) while the browser closes
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.run_until_complete(self._close_browser())
+        finally:
+            self._loop.close()
+            self._loop = None
     
     def search_vehicles(self, make: str, model: str, year: int) -> List[Dict[str, Any]]:
         """
         Search for vehicles matching the specified criteria.
         
+        Synchronous wrapper around search_vehicles_async.
+        
         Args:
             make: Vehicle make (e.g., "Toyota")
             model: Vehicle model (e.g., "Corolla")  
@@ -52,66 +368,139 @@ class AutochekScraper:
         Returns:
             List of vehicle dictionaries containing extracted data
         """
+        # Playwright objects are bound to the loop that created them, so every
+        # search runs on one loop owned by the scraper instead of asyncio.run
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self.search_vehicles_async(make, model, year))
+    
+    async def search_vehicles_async(self, make: str, model: str, year: int) -> List[Dict[str, Any]]:
+        """Search for vehicles, fetching result pages concurrently."""
+        # Normalize inputs once at entry
+        make, model = make.strip(), model.strip()
         self.logger.info(f"Searching for {make} {model} {year}")
         
         vehicles = []
         
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=self.headless)
-                page = browser.new_page()
+            # Server-rendered listings can be paged without a browser at all
+            vehicles = await asyncio.to_thread(self._fetch_static_listings)
+            if vehicles:
+                return [vehicle.to_dict() for vehicle in vehicles]
+            
+            context = await self._ensure_browser()
+            page = await context.new_page()
+            try:
+                # Record JSON endpoints the listings grid is loaded from
+                api_urls = []
+                page.on('response', lambda response: self._capture_listings_api(response, api_urls))
                 
                 # Navigate to the site
-                page.goto(self.base_url, timeout=30000)
+                await self._acquire(self.base_url)
+                await page.goto(self.base_url, timeout=30000)
                 
                 # Handle country selection if needed
-                self._handle_country_selection(page)
+                await self._handle_country_selection(page)
                 
                 # Perform search
-                search_results = self._perform_search(page, make, model, year)
+                search_results = await self._perform_search(page, make, model, year)
                 
-                # Extract listings from all pages
-                vehicles = self._extract_all_listings(page, search_results)
+                # Prefer paging the backend JSON API over rendering every page
+                for api_url in api_urls:
+                    vehicles = await asyncio.to_thread(self._fetch_api_listings, api_url)
+                    if vehicles:
+                        break
                 
-                browser.close()
+                # Extract listings from all rendered pages
+                if not vehicles:
+                    vehicles = await self._extract_all_listings(context, search_results)
+            finally:
+                await page.close()
+            
+            # Records stay slotted while scraping and become dicts only when returned
+            vehicles = [vehicle.to_dict() for vehicle in vehicles]
                 
         except Exception as e:
             self.logger.error(f"Error during scraping: {e}")
-            # Fallback to requests-based scraping if Playwright fails
-            vehicles = self._fallback_scraping(make, model, year)
+            # The browser may be unusable now; the next search relaunches it
+            await self._close_browser()
+            # Fallback to requests-based scraping if Playwright fails, off the loop
+            vehicles = await asyncio.to_thread(self._fallback_scraping, make, model, year)
         
         return vehicles
     
-    def _handle_country_selection(self, page) -> None:
+    async def _ensure_browser(self):
+        """Start Playwright, the browser and the shared context if not yet running."""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        if self._browser is None:
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        if self._context is None:
+            self._context = await self._browser.new_context(viewport=BROWSER_VIEWPORT)
+            await self._context.route('**/*', self._block_unused_requests)
+        return self._context
+    
+    async def _close_browser(self) -> None:
+        """Close the shared context, browser and Playwright driver, whichever were started."""
+        context, browser, playwright = self._context, self._browser, self._playwright
+        self._context = self._browser = self._playwright = None
+        try:
+            if context is not None:
+                await context.close()
+            if browser is not None:
+                await browser.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing browser: {e}")
+        finally:
+            if playwright is not None:
+                await playwright.stop()
+    
+    async def _acquire(self, url: str) -> None:
+        """
+        Wait for a request slot on the URL's host.
+        
+        Slots on a host are handed out rate_limit seconds apart and shared by
+        every task on the loop, so concurrent tabs draw on one budget.
+        """
+        if self.rate_limit <= 0:
+            return
+        host = urlsplit(url).hostname or ''
+        now = time.monotonic()
+        slot = max(now, self._next_request_at.get(host, now))
+        self._next_request_at[host] = slot + self.rate_limit
+        await asyncio.sleep(slot - now)
+    
+    async def _handle_country_selection(self, page) -> None:
         """Handle country selection on the homepage."""
         try:
             # Look for Nigeria flag or country selector
             nigeria_selector = 'img[alt*="Nigeria"], a[href*="/ng"], .country-ng'
-            if page.query_selector(nigeria_selector):
-                page.click(nigeria_selector)
-                page.wait_for_load_state('networkidle')
-                time.sleep(self.rate_limit)
+            if await page.query_selector(nigeria_selector):
+                await self._acquire(page.url)
+                await page.click(nigeria_selector)
+                await page.wait_for_load_state('domcontentloaded')
         except Exception as e:
             self.logger.warning(f"Could not select Nigeria: {e}")
     
-    def _perform_search(self, page, make: str, model: str, year: int) -> str:
+    async def _perform_search(self, page, make: str, model: str, year: int) -> str:
         """Navigate to Autochek Nigeria cars-for-sale page."""
-        cars_url = f"{self.base_url}/ng/cars-for-sale"
+        cars_url = build_listings_url(self.base_url)
         
         try:
             self.logger.info(f"Navigating to {cars_url}")
-            page.goto(cars_url, timeout=30000)
-            page.wait_for_load_state('networkidle')
-            time.sleep(self.rate_limit)
+            await self._acquire(cars_url)
+            await page.goto(cars_url, wait_until='domcontentloaded', timeout=PAGE_TIMEOUT)
+            await self._wait_for_listings(page)
             return cars_url
             
         except Exception as e:
             self.logger.error(f"Failed to navigate to cars page: {e}")
             # Fallback to base URL
-            page.goto(self.base_url, timeout=30000)
+            await self._acquire(self.base_url)
+            await page.goto(self.base_url, timeout=30000)
             return page.url
     
-    def _fill_search_form(self, page, make: str, model: str, year: int) -> bool:
+    async def _fill_search_form(self, page, make: str, model: str, year: int) -> bool:
         """Fill out search form if found."""
         try:
             # Common search form selectors
@@ -126,32 +515,32 @@ class AutochekScraper:
             
             # Try to fill make
             for selector in selectors['make']:
-                if page.query_selector(selector):
-                    page.select_option(selector, make)
+                if await page.query_selector(selector):
+                    await page.select_option(selector, make)
                     filled_any = True
                     break
             
             # Try to fill model
             for selector in selectors['model']:
-                if page.query_selector(selector):
-                    page.select_option(selector, model)
+                if await page.query_selector(selector):
+                    await page.select_option(selector, model)
                     filled_any = True
                     break
             
             # Try to fill year
             for selector in selectors['year']:
-                if page.query_selector(selector):
-                    page.select_option(selector, str(year))
+                if await page.query_selector(selector):
+                    await page.select_option(selector, str(year))
                     filled_any = True
                     break
             
             # Submit form if we filled anything
             if filled_any:
                 for selector in selectors['submit']:
-                    if page.query_selector(selector):
-                        page.click(selector)
-                        page.wait_for_load_state('networkidle')
-                        time.sleep(self.rate_limit)
+                    if await page.query_selector(selector):
+                        await self._acquire(page.url)
+                        await page.click(selector)
+                        await page.wait_for_load_state('domcontentloaded')
                         return True
             
             return filled_any
@@ -160,7 +549,7 @@ class AutochekScraper:
             self.logger.warning(f"Could not fill search form: {e}")
             return False
     
-    def _has_vehicle_listings(self, page) -> bool:
+    async def _has_vehicle_listings(self, page) -> bool:
         """Check if page contains vehicle listings."""
         listing_selectors = [
             '.vehicle-card', '.car-card', '.listing-card',
@@ -168,89 +557,84 @@ class AutochekScraper:
         ]
         
         for selector in listing_selectors:
-            if page.query_selector(selector):
+            if await page.query_selector(selector):
                 return True
         return False
     
-    def _extract_all_listings(self, page, search_url: str) -> List[Dict[str, Any]]:
-        """Extract listings from all pages with pagination using page_number parameter."""
-        vehicles = []
-        page_num = 1
-        base_url = f"{self.base_url}/ng/cars-for-sale"
+    async def _extract_all_listings(self, context, search_url: str) -> List[Vehicle]:
+        """
+        Extract listings from all result pages using the page_number parameter.
         
-        while True:
-            self.logger.info(f"Processing page {page_num}")
-            
-            # Navigate to specific page number
-            if page_num == 1:
-                page_url = base_url
-            else:
-                page_url = f"{base_url}?page_number={page_num}"
-            
-            try:
-                page.goto(page_url, timeout=30000)
-                page.wait_for_load_state('networkidle')
-                time.sleep(self.rate_limit)
-                
-                # Extract listings from current page
-                page_vehicles = self._extract_listings_from_page(page)
-                
-                if not page_vehicles:
-                    self.logger.info(f"No listings found on page {page_num}, stopping pagination")
-                    break
-                
-                vehicles.extend(page_vehicles)
-                self.logger.info(f"Extracted {len(page_vehicles)} vehicles from page {page_num}")
-                
-                page_num += 1
-                
-                # Add safety limit to prevent infinite loops - reduced for testing
-                if page_num > 6:  # Limit for testing - can be increased later
-                    self.logger.warning(f"Reached maximum page limit ({page_num-1}), stopping")
-                    break
+        Pages 1..MAX_PAGES are loaded concurrently, each in its own tab, with
+        at most MAX_PARALLEL_PAGES in flight. Results are stitched together in
+        page order up to the first page without listings.
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_PAGES)
+        
+        async def fetch_page(page_num: int) -> List[Vehicle]:
+            async with semaphore:
+                self.logger.info(f"Processing page {page_num}")
+                url = build_listings_url(self.base_url, page_num)
+                page = await context.new_page()
+                try:
+                    await self._acquire(url)
+                    await page.goto(url, wait_until='domcontentloaded', timeout=PAGE_TIMEOUT)
                     
-            except Exception as e:
-                self.logger.error(f"Error processing page {page_num}: {e}")
+                    # Extract listings from current page
+                    return await self._extract_listings_from_page(page)
+                except Exception as e:
+                    self.logger.error(f"Error processing page {page_num}: {e}")
+                    return []
+                finally:
+                    await page.close()
+        
+        results = await asyncio.gather(*(fetch_page(page_num) for page_num in range(1, MAX_PAGES + 1)))
+        
+        vehicles = []
+        seen = set()
+        for page_num, page_vehicles in enumerate(results, start=1):
+            # A page of only repeats means the grid has started over
+            page_vehicles = _new_listings(page_vehicles, seen)
+            if not page_vehicles:
+                self.logger.info(f"No new listings found on page {page_num}, stopping pagination")
                 break
+            
+            vehicles.extend(page_vehicles)
+            self.logger.info(f"Extracted {len(page_vehicles)} vehicles from page {page_num}")
         
         return vehicles
     
-    def _extract_listings_from_page(self, page) -> List[Dict[str, Any]]:
-        """Extract vehicle listings from current page using Autochek-specific selectors."""
-        vehicles = []
-        
-        # Wait for content to load
+    async def _wait_for_listings(self, page) -> None:
+        """Wait until listing links exist; trailing analytics requests are not waited for."""
         try:
-            page.wait_for_selector('h6.MuiTypography-h6', timeout=10000)
+            await page.wait_for_selector(LISTING_LINK_SELECTOR, timeout=LISTINGS_TIMEOUT)
         except Exception as e:
             self.logger.warning(f"Page content may not have loaded fully: {e}")
+    
+    async def _extract_listings_from_page(self, page) -> List[Vehicle]:
+        """Extract vehicle listings from current page using Autochek-specific selectors."""
+        await self._wait_for_listings(page)
         
-        # Look for vehicle cards - try different container selectors
-        card_selectors = [
-            'article',
-            '[data-testid*="car"]',
-            '.MuiCard-root',
-            'div[role="article"]',
-            'a[href*="/ng/car/"]'  # Links to individual car pages
-        ]
-        
-        cards = []
-        for selector in card_selectors:
-            cards = page.query_selector_all(selector)
-            if cards:
-                self.logger.info(f"Found {len(cards)} potential vehicle cards using selector: {selector}")
-                break
+        # Collect every card's fields in the browser with a single evaluate call
+        cards = await page.evaluate(_CARD_FIELDS_JS, _CARD_FIELD_SELECTORS)
+        return self._parse_listing_cards(cards, page.url)
+    
+    def _parse_listing_cards(self, cards: List[Dict[str, Any]], page_url: str) -> List[Vehicle]:
+        """Build vehicle records from the raw card fields returned by _CARD_FIELDS_JS."""
+        vehicles = []
         
         if not cards:
             self.logger.warning("No vehicle cards found on page")
             return vehicles
         
+        self.logger.info(f"Found {len(cards)} potential vehicle cards")
+        
         for i, card in enumerate(cards):
             try:
-                vehicle_data = self._extract_vehicle_data(card, page)
+                vehicle_data = self._extract_vehicle_data(card, page_url)
                 if vehicle_data and self._is_valid_vehicle_data(vehicle_data):
                     vehicles.append(vehicle_data)
-                    self.logger.debug(f"Successfully extracted vehicle {i+1}: {vehicle_data.get('make')} {vehicle_data.get('model')}")
+                    self.logger.debug(f"Successfully extracted vehicle {i+1}: {vehicle_data.make} {vehicle_data.model}")
                 else:
                     self.logger.debug(f"Skipped card {i+1}: insufficient data")
             except Exception as e:
@@ -259,178 +643,96 @@ class AutochekScraper:
         
         return vehicles
     
-    def _extract_vehicle_data(self, card, page) -> Optional[Dict[str, Any]]:
-        """Extract data from a single vehicle card using Autochek-specific selectors."""
+    def _extract_vehicle_data(self, card: Dict[str, Any], page_url: str) -> Optional[Vehicle]:
+        """Build a vehicle record from one card's raw fields."""
         try:
-            # Initialize vehicle data with None values
-            vehicle = {
-                'listing_id': None,
-                'make': None,
-                'model': None,
-                'year': None,
-                'variant': None,
-                'price': None,
-                'currency': None,
-                'mileage': None,
-                'location': None,
-                'listing_url': None,
-                'thumbnail_url': None,
-                'created_at': None
-            }
+            vehicle = Vehicle()
             
-            # Extract href from the card element (since we selected 'a[href*="/ng/car/"]')
-            href = card.get_attribute('href')
+            href = card.get('href')
             if not href or '/ng/car/' not in href:
                 return None  # Not a car listing
                 
             # Set up the listing URL and ID
-            vehicle['listing_url'] = urljoin(page.url, href)
+            vehicle.listing_url = urljoin(page_url, href)
             if '-ref-' in href:
-                vehicle['listing_id'] = href.split('-ref-')[-1]
-            
-            # Use the card as the container for data extraction
-            container = card
-            
-            # Extract make/model/year from h6 element - try multiple selectors
-            title_selectors = [
-                'h6.MuiTypography-root.MuiTypography-h6.css-1g399u0',
-                'h6.MuiTypography-h6',
-                'h6[class*="MuiTypography"]',
-                'h6',
-                '[class*="Typography"] h6'
-            ]
-            
-            title_text = None
-            for selector in title_selectors:
-                title_elem = container.query_selector(selector)
-                if title_elem:
-                    title_text = title_elem.text_content()
-                    if title_text and title_text.strip():
-                        title_text = title_text.strip()
-                        break
+                vehicle.listing_id = href.split('-ref-')[-1]
             
+            # Make/model/year come from the first non-empty title
+            title_text = next((t.strip() for t in card.get('title') or () if t and t.strip()), None)
             if title_text:
                 self._parse_autochek_title(title_text, vehicle)
             
-            # Extract price from p element - try multiple selectors
-            price_selectors = [
-                'p.MuiTypography-root.MuiTypography-body1.css-1bztvjj',
-                'p.MuiTypography-body1',
-                'p[class*="MuiTypography"]',
-                'p[class*="price"]',
-                '[class*="price"]',
-                'p'
-            ]
-            
-            for selector in price_selectors:
-                price_elem = container.query_selector(selector)
-                if price_elem:
-                    price_text = price_elem.text_content()
+            # One pass over the card's text covers price and mileage
+            card_text = card.get('text') or ''
+            
+            price_match = _PRICE_RE.search(card_text)
+            if price_match:
+                self._parse_price(price_match.group(), vehicle)
+            
+            mileage_match = _MILEAGE_RE.search(card_text)
+            if mileage_match:
+                self._parse_mileage(mileage_match.group(), vehicle)
+            
+            # Unmarked prices still need the element they sit in
+            if vehicle.price is None:
+                for price_text in card.get('price') or ():
                     if price_text and ('₦' in price_text or 'NGN' in price_text or price_text.replace(',', '').replace('.', '').isdigit()):
                         self._parse_price(price_text.strip(), vehicle)
                         break
             
-            # Extract mileage from span - try multiple selectors
-            mileage_selectors = [
-                'span.MuiChip-label.MuiChip-labelSmall.css-1pjtbja',
-                'span.MuiChip-label',
-                'span[class*="MuiChip"]',
-                'span[class*="chip"]',
-                '[class*="mileage"]'
-            ]
-            
-            for selector in mileage_selectors:
-                mileage_elem = container.query_selector(selector)
-                if mileage_elem:
-                    mileage_text = mileage_elem.text_content()
-                    if mileage_text and ('km' in mileage_text.lower() or 'mile' in mileage_text.lower()):
-                        self._parse_mileage(mileage_text.strip(), vehicle)
-                        break
+            # The location caption is kept whole when it names a city or is short
+            for location_text in card.get('location') or ():
+                location_text = (location_text or '').strip()
+                if location_text and (_CITY_RE.search(location_text) or len(location_text.split()) <= 3):
+                    vehicle.location = location_text
+                    break
+            
+            # Without a caption, take a city named anywhere on the card
+            if vehicle.location is None:
+                city_match = _CITY_RE.search(card_text)
+                if city_match:
+                    vehicle.location = city_match.group()
             
-            # Extract location from span - try multiple selectors
-            location_selectors = [
-                'span.MuiTypography-root.MuiTypography-caption.css-umr6w4',
-                'span.MuiTypography-caption',
-                'span[class*="MuiTypography-caption"]',
-                'span[class*="caption"]',
-                '[class*="location"]'
-            ]
-            
-            for selector in location_selectors:
-                location_elem = container.query_selector(selector)
-                if location_elem:
-                    location_text = location_elem.text_content()
-                    if location_text and location_text.strip():
-                        # Check if this looks like a location (has common Nigerian city names)
-                        location_text = location_text.strip()
-                        nigerian_cities = ['Lagos', 'Abuja', 'Kano', 'Ibadan', 'Port Harcourt', 'Benin', 'Jos', 'Ilorin', 'Kaduna', 'Oyo', 'Enugu', 'Abeokuta', 'Zaria', 'Aba', 'Maiduguri', 'Warri', 'Ebute Ikorodu', 'Sokoto', 'Onitsha', 'Calabar', 'Uyo', 'Katsina', 'Ado Ekiti', 'Gombe', 'Minna', 'Effon Alaiye', 'Ikeja', 'Victoria Island', 'Lekki', 'Yaba', 'Surulere']
-                        
-                        if any(city.lower() in location_text.lower() for city in nigerian_cities) or len(location_text.split()) <= 3:
-                            vehicle['location'] = location_text
-                            break
-            
-            # Extract thumbnail - try multiple approaches
-            img_selectors = [
-                'img[src*="http"]',
-                'img',
-                '[style*="background-image"]'
-            ]
-            
-            for selector in img_selectors:
-                img_elem = container.query_selector(selector)
-                if img_elem:
-                    # Try src attribute
-                    src = img_elem.get_attribute('src')
-                    if src and ('http' in src or src.startswith('//')):
-                        if not src.startswith('http'):
-                            src = 'https:' + src if src.startswith('//') else 'https://autochek.africa' + src
-                        vehicle['thumbnail_url'] = src
+            # Thumbnail from an image src, else a background-image style
+            for img in card.get('img') or ():
+                if not img:
+                    continue
+                src = img.get('src')
+                if src and ('http' in src or src.startswith('//')):
+                    if not src.startswith('http'):
+                        src = 'https:' + src if src.startswith('//') else 'https://autochek.africa' + src
+                    vehicle.thumbnail_url = src
+                    break
+                
+                style = img.get('style')
+                if style and 'background-image' in style:
+                    url_match = _BG_URL_RE.search(style)
+                    if url_match:
+                        url = url_match.group(1)
+                        if not url.startswith('http'):
+                            url = 'https:' + url if url.startswith('//') else 'https://autochek.africa' + url
+                        vehicle.thumbnail_url = url
                         break
-                    
-                    # Try background-image
-                    style = img_elem.get_attribute('style')
-                    if style and 'background-image' in style:
-                        import re
-                        url_match = re.search(r'url\(["\']?([^"\']+)["\']?\)', style)
-                        if url_match:
-                            url = url_match.group(1)
-                            if not url.startswith('http'):
-                                url = 'https:' + url if url.startswith('//') else 'https://autochek.africa' + url
-                            vehicle['thumbnail_url'] = url
-                            break
-            
-            # Try to find posting date - look for time elements or date patterns
-            date_selectors = [
-                'time',
-                '[datetime]',
-                '[class*="date"]',
-                '[class*="time"]',
-                'span[title]',
-                'div[title]'
-            ]
-            
-            for selector in date_selectors:
-                elements = container.query_selector_all(selector)
+            
+            # Posting date from a datetime attribute, a title tooltip or date-like text
+            for elements in card.get('date') or ():
                 for elem in elements:
-                    # Try datetime attribute first
-                    datetime_attr = elem.get_attribute('datetime')
+                    datetime_attr = elem.get('datetime')
                     if datetime_attr:
-                        vehicle['created_at'] = datetime_attr
+                        vehicle.created_at = datetime_attr
                         break
                     
-                    # Try title attribute
-                    title_attr = elem.get_attribute('title')
-                    if title_attr and ('ago' in title_attr or 'posted' in title_attr.lower() or any(month in title_attr for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])):
-                        vehicle['created_at'] = title_attr.strip()
+                    title_attr = elem.get('title')
+                    if title_attr and ('ago' in title_attr or 'posted' in title_attr.lower() or _mentions_month(title_attr)):
+                        vehicle.created_at = title_attr.strip()
                         break
                     
-                    # Try text content
-                    text_content = elem.text_content()
-                    if text_content and ('ago' in text_content or any(month in text_content for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])):
-                        vehicle['created_at'] = text_content.strip()
+                    text_content = elem.get('text')
+                    if text_content and ('ago' in text_content or _mentions_month(text_content)):
+                        vehicle.created_at = text_content.strip()
                         break
                 
-                if vehicle['created_at']:
+                if vehicle.created_at:
                     break
             
             return vehicle
@@ -439,140 +741,210 @@ class AutochekScraper:
             self.logger.error(f"Error extracting vehicle data: {e}")
             return None
     
-    def _get_text_from_selectors(self, element, selectors: List[str]) -> Optional[str]:
+    async def _get_text_from_selectors(self, element, selectors: List[str]) -> Optional[str]:
         """Get text content using multiple selector options."""
         for selector in selectors:
-            elem = element.query_selector(selector)
+            elem = await element.query_selector(selector)
             if elem:
-                text = elem.text_content()
+                text = await elem.text_content()
                 if text and text.strip():
                     return text.strip()
         return None
     
-    def _parse_autochek_title(self, title: str, vehicle: Dict[str, Any]) -> None:
+    def _parse_autochek_title(self, title: str, vehicle: Vehicle) -> None:
         """Parse vehicle make, model, year, variant from Autochek title."""
-        title = title.strip()
-        parts = title.split()
-        
-        if not parts:
-            return
-            
-        # Look for year first (4 digits)
-        year_found = False
-        year_index = -1
-        for i, part in enumerate(parts):
-            if part.isdigit() and len(part) == 4:
-                try:
-                    year = int(part)
-                    # Reasonable year range for vehicles
-                    if 1980 <= year <= 2030:
-                        vehicle['year'] = year
-                        year_found = True
-                        year_index = i
-                        break
-                except ValueError:
-                    continue
-        
-        # If year is found as first element, it means structure is "YEAR MAKE MODEL ..."
-        if year_found and year_index == 0 and len(parts) >= 3:
-            vehicle['make'] = parts[1]
-            vehicle['model'] = parts[2]
-            
-            # Everything after year, make, model could be variant
-            if len(parts) > 3:
-                remaining_parts = parts[3:]
-                vehicle['variant'] = ' '.join(remaining_parts)
-                
-        # Standard structure: "MAKE MODEL YEAR ..." or "MAKE MODEL ..."
-        elif len(parts) >= 2:
-            vehicle['make'] = parts[0]
-            vehicle['model'] = parts[1]
-            
-            # If year was found later in the string
-            if year_found and year_index > 1:
-                # Check if there are parts between model and year (could be variant)
-                if year_index > 2:
-                    variant_parts = parts[2:year_index]
-                    vehicle['variant'] = ' '.join(variant_parts)
-                
-                # Check if there are parts after year (could also be variant)
-                if year_index < len(parts) - 1:
-                    remaining_parts = parts[year_index + 1:]
-                    if vehicle.get('variant'):
-                        vehicle['variant'] += ' ' + ' '.join(remaining_parts)
-                    else:
-                        vehicle['variant'] = ' '.join(remaining_parts)
-            
-            # If no year found, everything after make and model could be variant
-            elif not year_found and len(parts) > 2:
-                variant_parts = parts[2:]
-                vehicle['variant'] = ' '.join(variant_parts)
-
-    def _parse_vehicle_title(self, title: str, vehicle: Dict[str, Any]) -> None:
+        parse_autochek_title(title, vehicle)
+
+    def _parse_vehicle_title(self, title: str, vehicle: Vehicle) -> None:
         """Parse vehicle make, model, year, variant from title (legacy method)."""
         # Delegate to the new Autochek-specific parser
         self._parse_autochek_title(title, vehicle)
     
-    def _parse_price(self, price_text: str, vehicle: Dict[str, Any]) -> None:
+    def _parse_price(self, price_text: str, vehicle: Vehicle) -> None:
         """Parse price and currency from price text."""
-        import re
+        parse_price(price_text, vehicle)
+    
+    def _parse_mileage(self, mileage_text: str, vehicle: Vehicle) -> None:
+        """Parse mileage from text."""
+        parse_mileage(mileage_text, vehicle)
+    
+    async def _block_unused_requests(self, route) -> None:
+        """Abort asset and analytics requests; let documents, scripts and XHR through."""
+        request = route.request
+        if (request.resource_type in BLOCKED_RESOURCE_TYPES
+                or any(host in request.url for host in BLOCKED_HOSTS)):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    def _capture_listings_api(self, response, api_urls: List[str]) -> None:
+        """Record same-site JSON API responses seen while the listings page loads."""
+        url = response.url
+        content_type = response.headers.get('content-type', '')
+        if (content_type.startswith('application/json') and _API_URL_RE.search(url)
+                and (urlsplit(url).hostname or '').endswith(SITE_DOMAIN) and url not in api_urls):
+            self.logger.debug(f"Captured candidate listings API: {url}")
+            api_urls.append(url)
+    
+    def _page_through(self, first_page: List[Vehicle], urls: List[str],
+                      parse_page: Callable[[Any, str], List[Vehicle]], source: str) -> List[Vehicle]:
+        """
+        Stitch the first page's listings onto the pages at ``urls``, fetched concurrently.
         
-        # Remove commas and extract numbers
-        numbers = re.findall(r'[\d,]+', price_text)
-        if numbers:
+        Paging stops at the first page that fails, cannot be parsed, or adds
+        no new listings; everything gathered before it is kept. Returns an
+        empty list if the first page has no listings.
+        """
+        seen = set()
+        vehicles = _new_listings(first_page, seen)
+        if not vehicles:
+            return []
+        
+        self.logger.info(f"Using {source}")
+        
+        responses = self.session.fetch_many(urls, return_exceptions=True, timeout=30)
+        for page_num, (url, response) in enumerate(zip(urls, responses), start=2):
             try:
-                price_str = numbers[0].replace(',', '')
-                vehicle['price'] = int(price_str)
-            except ValueError:
-                pass
-        
-        # Extract currency
-        currencies = ['NGN', 'N', '₦', 'USD', '$']
-        for currency in currencies:
-            if currency in price_text:
-                vehicle['currency'] = currency
+                if isinstance(response, Exception):
+                    raise response
+                page_vehicles = _new_listings(parse_page(response, url), seen)
+            except Exception as e:
+                self.logger.warning(f"Page {page_num} of {source} unusable, stopping pagination: {e}")
+                break
+            if not page_vehicles:
+                self.logger.info(f"No new listings found on page {page_num} of {source}, stopping pagination")
                 break
+            vehicles.extend(page_vehicles)
         
-        if not vehicle.get('currency'):
-            vehicle['currency'] = 'NGN'  # Default for Nigeria
+        return vehicles
     
-    def _parse_mileage(self, mileage_text: str, vehicle: Dict[str, Any]) -> None:
-        """Parse mileage from text."""
-        import re
+    def _fetch_static_listings(self) -> List[Vehicle]:
+        """
+        Page through server-rendered listings over the pooled session with selectolax.
         
-        numbers = re.findall(r'[\d,]+', mileage_text)
-        if numbers:
-            try:
-                mileage_str = numbers[0].replace(',', '')
-                vehicle['mileage'] = int(mileage_str)
-            except ValueError:
-                pass
+        Returns an empty list when selectolax is not installed or the first
+        page's HTML has no listing links, so the caller renders pages instead.
+        """
+        if not SELECTOLAX_AVAILABLE:
+            return []
+        
+        try:
+            first_url = build_listings_url(self.base_url)
+            response = self.session.get(first_url, timeout=30)
+            # Bytes go straight to lexbor, which honours <meta charset>; requests
+            # would decode charset-less text/html as ISO-8859-1 and garble '₦'
+            if b'/ng/car/' not in response.content:
+                self.logger.info("Listings are not in the initial HTML, rendering pages instead")
+                return []
+            
+            urls = [build_listings_url(self.base_url, page_num) for page_num in range(2, MAX_PAGES + 1)]
+            return self._page_through(
+                self._parse_static_listings(response.content, first_url), urls,
+                lambda page, url: self._parse_static_listings(page.content, url),
+                "server-rendered listings HTML"
+            )
+            
+        except Exception as e:
+            self.logger.warning(f"Server-rendered listings unusable: {e}")
+            return []
     
-    def _is_valid_vehicle_data(self, vehicle: Dict[str, Any]) -> bool:
-        """Check if vehicle data has minimum required information."""
-        # Must have at least make or model, and some other identifying information
-        required_fields = ['make', 'model']
-        identifying_fields = ['listing_id', 'listing_url', 'price', 'year']
+    def _parse_static_listings(self, html: bytes, page_url: str) -> List[Vehicle]:
+        """Extract vehicle listings from server-rendered listings HTML."""
+        cards = [_card_fields(card) for card in LexborHTMLParser(html).css(LISTING_LINK_SELECTOR)]
+        return self._parse_listing_cards(cards, page_url)
+    
+    def _fetch_api_listings(self, api_url: str) -> List[Vehicle]:
+        """
+        Page through a captured listings JSON endpoint over the pooled session.
+        
+        Returns an empty list if the endpoint does not yield vehicle records,
+        so the caller can fall back to the rendered pages.
+        """
+        try:
+            response = self.session.get(with_page_number(api_url, 1), timeout=30)
+            urls = [with_page_number(api_url, page_num) for page_num in range(2, MAX_PAGES + 1)]
+            return self._page_through(
+                self._parse_api_listings(loads_json(response.content)), urls,
+                lambda page, url: self._parse_api_listings(loads_json(page.content)),
+                f"listings API {api_url}"
+            )
+            
+        except Exception as e:
+            self.logger.warning(f"Listings API {api_url} unusable: {e}")
+            return []
+    
+    def _parse_api_listings(self, payload: Any) -> List[Vehicle]:
+        """Map listing records from a JSON API payload onto vehicles."""
+        records = payload
+        if isinstance(payload, dict):
+            records = next((payload[key] for key in _API_RECORD_KEYS if isinstance(payload.get(key), list)), [])
+        if not isinstance(records, list):
+            return []
+        
+        vehicles = []
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            vehicle = self._vehicle_from_api_record(record)
+            if self._is_valid_vehicle_data(vehicle):
+                vehicles.append(vehicle)
+        return vehicles
+    
+    def _vehicle_from_api_record(self, record: Dict[str, Any]) -> Vehicle:
+        """Build a vehicle from one API listing record."""
+        def pick(*keys):
+            for key in keys:
+                value = record.get(key)
+                if isinstance(value, dict):
+                    value = value.get('name')
+                if value not in (None, ''):
+                    return value
+            return None
         
-        # Check if we have basic make/model info
-        has_basic_info = any(vehicle.get(field) for field in required_fields)
+        vehicle = Vehicle(
+            listing_id=pick('id', 'carId', 'ref'),
+            make=pick('make'),
+            model=pick('model'),
+            currency=pick('currency') or 'NGN',
+            location=pick('city', 'location', 'state'),
+            listing_url=pick('websiteUrl', 'url'),
+            thumbnail_url=pick('imageUrl', 'thumbnail', 'image'),
+            created_at=pick('createdAt', 'created_at')
+        )
+        
+        title = pick('carName', 'title', 'name')
+        if title and not (vehicle.make and vehicle.model):
+            self._parse_autochek_title(str(title), vehicle)
+        
+        for field, keys in (('year', ('year',)),
+                            ('price', ('marketplacePrice', 'price', 'sellingPrice')),
+                            ('mileage', ('mileage',))):
+            value = pick(*keys)
+            if value is not None:
+                try:
+                    setattr(vehicle, field, int(value))
+                except (TypeError, ValueError):
+                    pass
         
-        # Check if we have some identifying information
-        has_identifying_info = any(vehicle.get(field) for field in identifying_fields)
+        if vehicle.listing_id is not None:
+            vehicle.listing_id = str(vehicle.listing_id)
         
-        return has_basic_info and has_identifying_info
+        return vehicle
+    
+    def _is_valid_vehicle_data(self, vehicle: Vehicle) -> bool:
+        """Check if vehicle data has minimum required information."""
+        return is_valid_vehicle_data(vehicle)
     
-    @retry_on_5xx(max_attempts=3, min_wait=1.0, max_wait=10.0)
     def _fallback_scraping(self, make: str, model: str, year: int) -> List[Dict[str, Any]]:
         """Fallback scraping using requests with retry logic if Playwright fails."""
         self.logger.info("Using fallback scraping with requests (with retry logic)")
         
         try:
-            # This will now automatically retry on 5xx errors
+            # The session's adapter retries 5xx errors with backoff
             response = self.session.get(self.base_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # This is a basic fallback - in reality would need to be
             # adapted based on actual website structure
@@ -606,17 +978,19 @@ class AutochekScraper:
             self.logger.warning("No vehicles to save to CSV")
             return
         
-        fieldnames = [
-            'listing_id', 'make', 'model', 'year', 'variant', 
-            'price', 'currency', 'mileage', 'location', 
-            'listing_url', 'thumbnail_url', 'created_at'
-        ]
-        
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(vehicles)
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+                csvfile.write(','.join(CSV_FIELDNAMES) + CSV_LINE_TERMINATOR)
+                
+                # Write rows in large blocks rather than one write per row
+                block = []
+                for line in self._iter_csv_lines(vehicles):
+                    block.append(line)
+                    if len(block) >= CSV_BLOCK_ROWS:
+                        csvfile.write(''.join(block))
+                        block = []
+                if block:
+                    csvfile.write(''.join(block))
             
             self.logger.info(f"Successfully saved {len(vehicles)} vehicles to CSV: {output_path}")
             
@@ -624,14 +998,81 @@ class AutochekScraper:
             self.logger.error(f"Error saving to CSV: {e}")
             raise
     
+    def _iter_csv_lines(self, vehicles: List[Dict[str, Any]]):
+        """Yield formatted CSV lines, quoting via csv.writer only when a field needs it."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator=CSV_LINE_TERMINATOR)
+        
+        for vehicle in vehicles:
+            try:
+                values = _CSV_ROW_GETTER(vehicle)
+            except KeyError:
+                # Partial records (e.g. hand-built data) miss some columns
+                values = [vehicle.get(field) for field in CSV_FIELDNAMES]
+            cells = ['' if value is None else str(value) for value in values]
+            
+            if _CSV_QUOTE_RE.search(''.join(cells)):
+                # Slow path: let the csv module handle quoting and escaping
+                writer.writerow(cells)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            else:
+                yield ','.join(cells) + CSV_LINE_TERMINATOR
+    
     def save_to_json(self, vehicles: List[Dict[str, Any]], output_path: str) -> None:
         """Save vehicle data to JSON file."""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(vehicles, f, indent=2, ensure_ascii=False)
+            # Serialize up front and write the bytes in a single call
+            with open(output_path, 'wb') as f:
+                f.write(dumps_json(vehicles))
             
             self.logger.info(f"Successfully saved {len(vehicles)} vehicles to JSON: {output_path}")
             
         except Exception as e:
             self.logger.error(f"Error saving to JSON: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    def save_to_ndjson(self, vehicles: List[Dict[str, Any]], output_path: str) -> None:
+        """Save vehicle data as newline-delimited JSON, one record per line."""
+        try:
+            # Records are encoded one at a time; no whole-document string is built
+            with open(output_path, 'wb') as f:
+                f.writelines(iter_ndjson(vehicles))
+            
+            self.logger.info(f"Successfully saved {len(vehicles)} vehicles to NDJSON: {output_path}")
+            
+        except Exception as e:
+            self.logger.error(f"Error saving to NDJSON: {e}")
+            raise
+    
+    def save_to_parquet(self, vehicles: List[Dict[str, Any]], output_path: str) -> None:
+        """Save vehicle data to a zstd-compressed Parquet file."""
+        try:
+            table = self._to_arrow_table(vehicles)
+            pyarrow.parquet.write_table(table, output_path, compression=ARROW_COMPRESSION)
+            
+            self.logger.info(f"Successfully saved {len(vehicles)} vehicles to Parquet: {output_path}")
+            
+        except Exception as e:
+            self.logger.error(f"Error saving to Parquet: {e}")
+            raise
+    
+    def save_to_feather(self, vehicles: List[Dict[str, Any]], output_path: str) -> None:
+        """Save vehicle data to a zstd-compressed Feather file."""
+        try:
+            table = self._to_arrow_table(vehicles)
+            pyarrow.feather.write_feather(table, output_path, compression=ARROW_COMPRESSION)
+            
+            self.logger.info(f"Successfully saved {len(vehicles)} vehicles to Feather: {output_path}")
+            
+        except Exception as e:
+            self.logger.error(f"Error saving to Feather: {e}")
+            raise
+    
+    def _to_arrow_table(self, vehicles: List[Dict[str, Any]]):
+        """Convert vehicle dictionaries into a columnar Arrow table."""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Parquet and Feather output")
+        
+        return pyarrow.Table.from_pylist(vehicles, schema=_arrow_schema())
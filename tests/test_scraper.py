@@ -3,170 +3,412 @@
 Unit tests for Autochek Africa Vehicle Scraper
 """
 
+import asyncio
+import csv
+import io
+import json
 import sys
-import os
+import time
+from types import SimpleNamespace
+import pytest
+import requests
+from urllib3.exceptions import ConnectTimeoutError
+from unittest.mock import AsyncMock, Mock, patch, create_autospec
+from playwright.async_api import Browser, BrowserContext, BrowserType, Page, Playwright
+from autochek_scraper.scraper import AutochekScraper, CSV_FIELDNAMES, build_listings_url
+from autochek_scraper._parse import Vehicle
+from autochek_scraper.cli import get_output_targets, main, parse_arguments
+from autochek_scraper import retry_utils
+from autochek_scraper import scraper as scraper_module
+from autochek_scraper.retry_utils import RetryableHTTPSession, HTTPRetryError
 
-# Add src to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-import json
-import pytest
-from unittest.mock import Mock, patch, MagicMock
-from autochek_scraper.scraper import AutochekScraper
-from autochek_scraper.cli import main, parse_arguments
+# Server-rendered HTML for a single Autochek listing card
+LISTING_HTML = """
+<html><body>
+  <a href="/ng/car/toyota-corolla-ref-test123">
+    <img src="https://media.autochek.africa/test-123.jpg">
+    <h6 class="MuiTypography-root MuiTypography-h6">Toyota Corolla 2015 LE</h6>
+    <p class="MuiTypography-root MuiTypography-body1">NGN 5,500,000</p>
+    <span class="MuiChip-label">85,000 km</span>
+    <span class="MuiTypography-root MuiTypography-caption">Lagos</span>
+  </a>
+  <a href="/ng/about">About</a>
+</body></html>
+"""
+
+# Raw card fields, as returned by the in-page extraction script, for one listing
+LISTING_CARD = {
+    'href': '/ng/car/toyota-corolla-ref-test123',
+    'text': ' Toyota Corolla 2015 LE NGN 5,500,000 85,000 km Lagos ',
+    'title': ['Toyota Corolla 2015 LE'],
+    'price': ['NGN 5,500,000'],
+    'location': ['Lagos'],
+    'img': [{'src': 'https://media.autochek.africa/test-123.jpg', 'style': None}],
+    'date': [[]]
+}
+
+
+@pytest.fixture(scope='module')
+def scraper():
+    """One scraper shared by the module's tests, closed once they finish."""
+    with AutochekScraper(rate_limit=0.1, headless=True) as scraper:
+        yield scraper
+
+
+@pytest.fixture(scope='module')
+def playwright_graph():
+    """Autospecced Playwright driver, browser, context and page serving LISTING_CARD."""
+    mock_p = create_autospec(Playwright, instance=True)
+    mock_p.chromium = create_autospec(BrowserType, instance=True)
+    mock_browser = create_autospec(Browser, instance=True)
+    mock_context = create_autospec(BrowserContext, instance=True)
+    mock_page = create_autospec(Page, instance=True)
+    
+    mock_p.chromium.launch.return_value = mock_browser
+    mock_browser.new_context.return_value = mock_context
+    mock_context.new_page.return_value = mock_page
+    
+    # Mock page navigation
+    mock_page.goto.return_value = None
+    mock_page.url = "https://autochek.africa/ng/cars-for-sale"
+    
+    # Mock in-page card extraction
+    mock_page.evaluate.return_value = [LISTING_CARD]
+    
+    # No country selector or search form is present
+    mock_page.query_selector.return_value = None
+    
+    return SimpleNamespace(p=mock_p, browser=mock_browser, context=mock_context, page=mock_page)
+
+
+@pytest.fixture(scope='module')
+def listing_page():
+    """Factory for a fetched listings page holding the given listing IDs, as API JSON or HTML."""
+    def page(*ids, html=False):
+        if html:
+            body = ''.join(LISTING_HTML.replace('ref-test123', f'ref-{i}') for i in ids)
+        else:
+            body = json.dumps({'result': [
+                {'id': i, 'make': 'Toyota', 'model': 'Corolla', 'year': 2015} for i in ids
+            ]})
+        return Mock(content=body.encode('utf-8'))
+    return page
+
+
+def _install_playwright_mock(mock_playwright, graph=None, raise_exc=None):
+    """Point a patched async_playwright at the mock graph, or make it raise."""
+    if raise_exc is not None:
+        mock_playwright.side_effect = raise_exc
+        return
+    for mock in (graph.p, graph.browser, graph.context, graph.page):
+        mock.reset_mock()
+    mock_playwright.return_value.start = AsyncMock(return_value=graph.p)
 
 
 class TestAutochekScraper:
     """Test class for AutochekScraper functionality."""
     
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.scraper = AutochekScraper(rate_limit=0.1, headless=True)
-    
-    def test_scraper_initialization(self):
+    def test_scraper_initialization(self, scraper):
         """Test scraper initializes correctly."""
-        assert self.scraper.rate_limit == 0.1
-        assert self.scraper.headless == True
-        assert self.scraper.base_url == "https://autochek.africa"
-        assert self.scraper.session is not None
+        assert scraper.rate_limit == 0.1
+        assert scraper.headless == True
+        assert scraper.base_url == "https://autochek.africa"
+        assert scraper.session is not None
     
-    def test_parse_vehicle_title(self):
+    @pytest.mark.parametrize('title,make,model,year,variant', [
+        ("Toyota Corolla 2015 LE", 'Toyota', 'Corolla', 2015, 'LE'),
+        ("Honda Civic 2018", 'Honda', 'Civic', 2018, None),
+        ("Toyota Corolla ²⁰¹⁵ LE", 'Toyota', 'Corolla', None, '²⁰¹⁵ LE'),
+    ])
+    def test_parse_vehicle_title(self, scraper, title, make, model, year, variant):
         """Test vehicle title parsing."""
-        vehicle = {}
-        
-        # Test basic title parsing
-        self.scraper._parse_vehicle_title("Toyota Corolla 2015 LE", vehicle)
-        assert vehicle['make'] == 'Toyota'
-        assert vehicle['model'] == 'Corolla'
-        assert vehicle['year'] == 2015
-        assert vehicle['variant'] == 'LE'
-        
-        # Test without variant
-        vehicle = {}
-        self.scraper._parse_vehicle_title("Honda Civic 2018", vehicle)
-        assert vehicle['make'] == 'Honda'
-        assert vehicle['model'] == 'Civic'
-        assert vehicle['year'] == 2018
-    
-    def test_parse_price(self):
+        vehicle = Vehicle()
+        scraper._parse_vehicle_title(title, vehicle)
+        assert vehicle.make == make
+        assert vehicle.model == model
+        assert vehicle.year == year
+        assert vehicle.variant == variant
+    
+    @pytest.mark.parametrize('price_text,price,currency', [
+        ("NGN 5,500,000", 5500000, 'NGN'),
+        ("$12,000", 12000, '$'),
+        # Price without currency defaults to NGN
+        ("3,200,000", 3200000, 'NGN'),
+    ])
+    def test_parse_price(self, scraper, price_text, price, currency):
         """Test price parsing functionality."""
-        vehicle = {}
-        
-        # Test NGN price
-        self.scraper._parse_price("NGN 5,500,000", vehicle)
-        assert vehicle['price'] == 5500000
-        assert vehicle['currency'] == 'NGN'
-        
-        # Test USD price
-        vehicle = {}
-        self.scraper._parse_price("$12,000", vehicle)
-        assert vehicle['price'] == 12000
-        assert vehicle['currency'] == '$'
-        
-        # Test price without currency (should default to NGN)
-        vehicle = {}
-        self.scraper._parse_price("3,200,000", vehicle)
-        assert vehicle['price'] == 3200000
-        assert vehicle['currency'] == 'NGN'
-    
-    def test_parse_mileage(self):
+        vehicle = Vehicle()
+        scraper._parse_price(price_text, vehicle)
+        assert vehicle.price == price
+        assert vehicle.currency == currency
+    
+    @pytest.mark.parametrize('mileage_text,mileage', [
+        ("85,000 km", 85000),
+        ("45000 km", 45000),
+    ])
+    def test_parse_mileage(self, scraper, mileage_text, mileage):
         """Test mileage parsing functionality."""
-        vehicle = {}
-        
-        # Test basic mileage
-        self.scraper._parse_mileage("85,000 km", vehicle)
-        assert vehicle['mileage'] == 85000
-        
-        # Test mileage without comma
-        vehicle = {}
-        self.scraper._parse_mileage("45000 km", vehicle)
-        assert vehicle['mileage'] == 45000
+        vehicle = Vehicle()
+        scraper._parse_mileage(mileage_text, vehicle)
+        assert vehicle.mileage == mileage
     
-    @patch('autochek_scraper.scraper.sync_playwright')
-    def test_search_vehicles_with_mock_data(self, mock_playwright):
+    @patch('autochek_scraper.scraper.async_playwright')
+    def test_search_vehicles_with_mock_data(self, mock_playwright, scraper, playwright_graph):
         """Test search_vehicles method returns at least one listing for known make/model/year."""
-        # Mock playwright context
-        mock_p = MagicMock()
-        mock_browser = MagicMock()
-        mock_page = MagicMock()
+        _install_playwright_mock(mock_playwright, playwright_graph)
+        mock_p, mock_browser, mock_context = playwright_graph.p, playwright_graph.browser, playwright_graph.context
         
-        mock_playwright.return_value.__enter__.return_value = mock_p
-        mock_p.chromium.launch.return_value = mock_browser
-        mock_browser.new_page.return_value = mock_page
+        # Listings are not server-rendered, so the browser is used
+        with patch.object(scraper, '_fetch_static_listings', return_value=[]):
+            # Run the search
+            vehicles = scraper.search_vehicles("Toyota", "Corolla", 2015)
         
-        # Mock page navigation
-        mock_page.goto.return_value = None
-        mock_page.url = "https://autochek.africa/cars"
+        # Assertions
+        assert len(vehicles) >= 1, "Should return at least one vehicle"
         
-        # Mock vehicle card elements
-        mock_card = MagicMock()
-        mock_page.query_selector_all.return_value = [mock_card]
+        if vehicles:
+            vehicle = vehicles[0]
+            assert vehicle['make'] == 'Toyota'
+            assert vehicle['model'] == 'Corolla'
+            assert vehicle['year'] == 2015
+            assert vehicle['price'] == 5500000
+            assert vehicle['mileage'] == 85000
+            assert vehicle['location'] == 'Lagos'
+            assert vehicle['listing_id'] == 'test123'
+            assert vehicle['listing_url'] == 'https://autochek.africa/ng/car/toyota-corolla-ref-test123'
+            assert vehicle['thumbnail_url'] == 'https://media.autochek.africa/test-123.jpg'
         
-        # Mock link extraction
-        mock_link = MagicMock()
-        mock_link.get_attribute.return_value = "/cars/test-123"
-        mock_card.query_selector.return_value = mock_link
+        # Result pages are opened in their own tabs
+        assert mock_context.new_page.call_count > 1
+        mock_context.route.assert_awaited_once_with('**/*', scraper._block_unused_requests)
         
-        # Mock text content
-        mock_title = MagicMock()
-        mock_title.text_content.return_value = "Toyota Corolla 2015 LE"
+        # The browser is launched once and shared by later searches until close()
+        with patch.object(scraper, '_fetch_static_listings', return_value=[]):
+            scraper.search_vehicles("Honda", "Civic", 2018)
+        mock_p.chromium.launch.assert_awaited_once()
+        mock_browser.new_context.assert_awaited_once()
         
-        mock_price = MagicMock()
-        mock_price.text_content.return_value = "NGN 5,500,000"
+        scraper.close()
+        mock_browser.close.assert_awaited_once()
+        mock_p.stop.assert_awaited_once()
+
+    def test_close_cancels_interrupted_search(self):
+        """Test close() cancels a search left pending by Ctrl-C instead of letting it fall back."""
+        scraper = AutochekScraper(rate_limit=0)
+        scraper._loop = asyncio.new_event_loop()
+        started = asyncio.Event()
         
-        mock_mileage = MagicMock()
-        mock_mileage.text_content.return_value = "85,000 km"
+        async def hang():
+            started.set()
+            await asyncio.Event().wait()
         
-        mock_location = MagicMock()
-        mock_location.text_content.return_value = "Lagos"
+        with patch.object(scraper, '_fetch_static_listings', return_value=[]), \
+                patch.object(scraper, '_ensure_browser', hang), \
+                patch.object(scraper, '_fallback_scraping') as mock_fallback:
+            # The search is suspended mid-flight, as it is after a KeyboardInterrupt
+            task = scraper._loop.create_task(scraper.search_vehicles_async("Toyota", "Corolla", 2015))
+            scraper._loop.run_until_complete(started.wait())
+            scraper.close()
         
-        # Configure query_selector to return appropriate mocks
-        def query_selector_side_effect(selector):
-            if 'a[href]' in selector:
-                return mock_link
-            elif any(s in selector for s in ['.title', '.name', 'h2', 'h3']):
-                return mock_title
-            elif '.price' in selector:
-                return mock_price
-            elif '.mileage' in selector:
-                return mock_mileage
-            elif '.location' in selector:
-                return mock_location
-            elif 'img' in selector:
-                mock_img = MagicMock()
-                mock_img.get_attribute.return_value = "/images/test-123.jpg"
-                return mock_img
-            return None
+        assert task.cancelled()
+        mock_fallback.assert_not_called()
+
+    def test_parse_listing_cards_selector_fallback(self, scraper):
+        """Test unmarked prices and non-city locations fall back to their selectors."""
+        card = dict(LISTING_CARD, text='Toyota Corolla 2015 LE 5,500,000 85,000 km Gwarinpa',
+                    price=[None, '5,500,000'], location=['Gwarinpa'])
+        other = {'href': '/ng/about', 'text': 'About', 'title': [], 'price': [], 'location': [], 'img': [], 'date': []}
+
+        vehicles = scraper._parse_listing_cards([card, other], 'https://autochek.africa/ng/cars-for-sale')
+
+        assert len(vehicles) == 1
+        assert vehicles[0].price == 5500000
+        assert vehicles[0].mileage == 85000
+        assert vehicles[0].location == 'Gwarinpa'
+
+    @pytest.mark.parametrize('text,location,expected', [
+        ('Toyota Corolla 2015 LE Ikeja, Lagos', ['Ikeja, Lagos'], 'Ikeja, Lagos'),
+        ('Toyota Corolla 2015 Benin import Gwarinpa', ['Gwarinpa'], 'Gwarinpa'),
+        ('Toyota Corolla 2015 LE Sold in Port Harcourt', [], 'Port Harcourt'),
+    ])
+    def test_extract_vehicle_data_location(self, scraper, text, location, expected):
+        """Test the location caption wins over cities in the card text, which only fill a missing caption."""
+        card = dict(LISTING_CARD, text=text, location=location)
         
-        mock_card.query_selector.side_effect = query_selector_side_effect
+        vehicle = scraper._extract_vehicle_data(card, 'https://autochek.africa/ng/cars-for-sale')
         
-        # Mock next page (no next page available)
-        def next_page_query(selector):
-            return None
+        assert vehicle.location == expected
+
+    @pytest.mark.parametrize('date,expected', [
+        ({'datetime': '2024-01-15T10:00:00Z', 'title': None, 'text': ''}, '2024-01-15T10:00:00Z'),
+        ({'datetime': None, 'title': 'Posted 15 Jan, 2024', 'text': ''}, 'Posted 15 Jan, 2024'),
+        ({'datetime': None, 'title': None, 'text': ' September 3 '}, 'September 3'),
+        ({'datetime': None, 'title': 'Marketplace', 'text': 'Mileage checked'}, None),
+    ])
+    def test_extract_vehicle_data_created_at(self, scraper, date, expected):
+        """Test the posting date is taken from datetime, title or month-bearing text."""
+        card = dict(LISTING_CARD, date=[[date]])
         
-        mock_page.query_selector.side_effect = next_page_query
+        vehicle = scraper._extract_vehicle_data(card, 'https://autochek.africa/ng/cars-for-sale')
         
-        # Run the search
-        vehicles = self.scraper.search_vehicles("Toyota", "Corolla", 2015)
+        assert vehicle.created_at == expected
+
+    @pytest.mark.parametrize('fields,valid', [
+        ({'make': 'Toyota', 'listing_id': 'a-1'}, True),
+        ({'model': 'Corolla', 'year': 2015}, True),
+        ({'make': 'Toyota'}, False),
+        ({'listing_url': 'https://autochek.africa/ng/car/x', 'price': 5500000}, False),
+        ({'make': '', 'model': 'Corolla', 'price': 0}, False),
+    ])
+    def test_is_valid_vehicle_data(self, scraper, fields, valid):
+        """Test a listing needs a make or model plus an identifying field."""
+        assert scraper._is_valid_vehicle_data(Vehicle(**fields)) is valid
+
+    def test_acquire_spaces_requests_per_host(self, scraper):
+        """Test navigations to one host share a single rate budget."""
+        async def run():
+            for url in (
+                'https://autochek.africa/ng/cars-for-sale',
+                'https://autochek.africa/ng/cars-for-sale?page_number=2',
+                'https://api.autochek.africa/v1/inventory/car',
+                'https://autochek.africa/ng/cars-for-sale?page_number=3',
+            ):
+                await scraper._acquire(url)
+
+        # A frozen clock makes the requested waits exact
+        clock = Mock(monotonic=Mock(return_value=100.0))
+        with patch.object(scraper, 'rate_limit', 0.05), patch.object(scraper, '_next_request_at', {}), \
+                patch.object(scraper_module, 'time', clock), \
+                patch.object(scraper_module.asyncio, 'sleep', new_callable=AsyncMock) as mock_sleep:
+            asyncio.run(run())
+
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert delays == pytest.approx([0.0, 0.05, 0.0, 0.1])
+
+    @pytest.mark.parametrize('resource_type,url,blocked', [
+        ('image', 'https://media.autochek.africa/a.jpg', True),
+        ('font', 'https://autochek.africa/fonts/roboto.woff2', True),
+        ('script', 'https://www.googletagmanager.com/gtm.js', True),
+        ('document', 'https://autochek.africa/ng/cars-for-sale', False),
+        ('fetch', 'https://api.autochek.africa/v1/inventory/car', False),
+    ])
+    def test_block_unused_requests(self, scraper, resource_type, url, blocked):
+        """Test asset and analytics requests are aborted and the rest continue."""
+        route = AsyncMock()
+        route.request = Mock(resource_type=resource_type, url=url)
+
+        asyncio.run(scraper._block_unused_requests(route))
+
+        assert route.abort.await_count == int(blocked)
+        assert route.continue_.await_count == int(not blocked)
+
+    def test_parse_api_listings(self, scraper):
+        """Test mapping listing records from a JSON API payload."""
+        payload = {'result': [
+            {'id': 'BAZ8UQt5b', 'carName': 'Toyota Corolla 2015 LE', 'marketplacePrice': 5500000,
+             'mileage': '85000', 'city': 'Lagos', 'imageUrl': 'https://media.autochek.africa/a.jpg'},
+            {'unrelated': True}
+        ]}
         
-        # Assertions
-        assert len(vehicles) >= 1, "Should return at least one vehicle"
+        vehicles = scraper._parse_api_listings(payload)
         
-        if vehicles:
-            vehicle = vehicles[0]
-            assert vehicle['make'] == 'Toyota'
-            assert vehicle['model'] == 'Corolla'
-            assert vehicle['year'] == 2015
-            assert vehicle['price'] is not None
-            assert vehicle['listing_url'] is not None
+        assert len(vehicles) == 1
+        assert vehicles[0].listing_id == 'BAZ8UQt5b'
+        assert vehicles[0].make == 'Toyota'
+        assert vehicles[0].year == 2015
+        assert vehicles[0].price == 5500000
+        assert vehicles[0].mileage == 85000
+        assert vehicles[0].location == 'Lagos'
+    
+    def test_fetch_api_listings_pages_until_empty(self, scraper, listing_page):
+        """Test the captured API is paged over the session until a page is empty."""
+        with patch.object(scraper.session, 'get', return_value=listing_page('a-1')) as mock_get, \
+                patch.object(scraper.session, 'fetch_many',
+                             return_value=[listing_page('a-2'), listing_page(), listing_page('a-3')]) as mock_many:
+            vehicles = scraper._fetch_api_listings('https://api.autochek.africa/v1/inventory/car?page_size=20')
+        
+        assert [v.listing_id for v in vehicles] == ['a-1', 'a-2']
+        assert mock_get.call_args[0][0].endswith('page_size=20&page_number=1')
+        assert mock_many.call_args[0][0][0].endswith('page_number=2')
+
+    def test_fetch_api_listings_skips_repeats(self, scraper, listing_page):
+        """Test listings repeated across pages are dropped and an all-repeat page ends paging."""
+        with patch.object(scraper.session, 'get', return_value=listing_page('a-1', 'a-1')), \
+                patch.object(scraper.session, 'fetch_many',
+                             return_value=[listing_page('a-2', 'a-1'), listing_page('a-2'), listing_page('a-3')]):
+            vehicles = scraper._fetch_api_listings('https://api.autochek.africa/v1/inventory/car')
+
+        assert [v.listing_id for v in vehicles] == ['a-1', 'a-2']
+
+    def test_fetch_api_listings_keeps_pages_before_failure(self, scraper, listing_page):
+        """Test a failed or non-JSON API page ends paging without dropping earlier pages."""
+        for failure in (Mock(content=b'<html>502</html>'), requests.HTTPError('502 Server Error')):
+            with patch.object(scraper.session, 'get', return_value=listing_page('a-1')), \
+                    patch.object(scraper.session, 'fetch_many',
+                                 return_value=[listing_page('a-2'), failure, listing_page('a-3')]):
+                vehicles = scraper._fetch_api_listings('https://api.autochek.africa/v1/inventory/car')
+
+            assert [v.listing_id for v in vehicles] == ['a-1', 'a-2']
+
+    def test_fetch_static_listings_pages_html(self, scraper, listing_page):
+        """Test server-rendered listings are parsed with selectolax and paged without a browser."""
+        if not scraper_module.SELECTOLAX_AVAILABLE:
+            pytest.skip("selectolax not installed")
+        
+        with patch.object(scraper.session, 'get', return_value=listing_page('test123', html=True)), \
+                patch.object(scraper.session, 'fetch_many',
+                             return_value=[listing_page(ref, html=True) for ref in ('b', 'b', 'c')]), \
+                patch.object(scraper_module, 'async_playwright') as mock_playwright:
+            vehicles = scraper.search_vehicles("Toyota", "Corolla", 2015)
+        
+        mock_playwright.assert_not_called()
+        assert [v['listing_id'] for v in vehicles] == ['test123', 'b']
+        assert vehicles[0]['price'] == 5500000
+        assert vehicles[0]['location'] == 'Lagos'
+        assert vehicles[0]['thumbnail_url'] == 'https://media.autochek.africa/test-123.jpg'
+    
+    def test_fetch_static_listings_keeps_pages_before_failure(self, scraper, listing_page):
+        """Test a 5xx page ends static paging without discarding earlier pages."""
+        if not scraper_module.SELECTOLAX_AVAILABLE:
+            pytest.skip("selectolax not installed")
+        
+        with patch.object(scraper.session, 'get', return_value=listing_page('test123', html=True)), \
+                patch.object(scraper.session, 'fetch_many',
+                             return_value=[listing_page('b', html=True), requests.HTTPError('503 Server Error'),
+                                           listing_page('c', html=True)]):
+            vehicles = scraper._fetch_static_listings()
+        
+        assert [v.listing_id for v in vehicles] == ['test123', 'b']
     
-    @patch('autochek_scraper.scraper.sync_playwright')
-    def test_fallback_scraping(self, mock_playwright):
+    def test_fetch_static_listings_decodes_bytes(self, scraper):
+        """Test charset-less HTML is parsed from bytes, keeping non-ASCII prices intact."""
+        if not scraper_module.SELECTOLAX_AVAILABLE:
+            pytest.skip("selectolax not installed")
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'text/html'
+        response._content = LISTING_HTML.replace('NGN 5,500,000', '₦ 5,500,000').encode('utf-8')
+        
+        with patch.object(scraper.session, 'get', return_value=response), \
+                patch.object(scraper.session, 'fetch_many', return_value=[]):
+            vehicles = scraper._fetch_static_listings()
+        
+        assert vehicles[0].price == 5500000
+        assert vehicles[0].currency == '₦'
+    
+    def test_fetch_static_listings_needs_rendered_links(self, scraper):
+        """Test HTML without listing links defers to the browser."""
+        with patch.object(scraper.session, 'get', return_value=Mock(content=b'<div id="__next"></div>')):
+            assert scraper._fetch_static_listings() == []
+    
+    @patch('autochek_scraper.scraper.async_playwright')
+    def test_fallback_scraping(self, mock_playwright, scraper):
         """Test fallback scraping when Playwright fails."""
-        # Mock playwright to raise an exception
-        mock_playwright.side_effect = Exception("Playwright failed")
+        _install_playwright_mock(mock_playwright, raise_exc=Exception("Playwright failed"))
         
-        with patch.object(self.scraper, '_fallback_scraping') as mock_fallback:
+        with patch.object(scraper, '_fetch_static_listings', return_value=[]), \
+                patch.object(scraper, '_fallback_scraping') as mock_fallback:
             mock_fallback.return_value = [{
                 'listing_id': 'fallback-001',
                 'make': 'Toyota',
@@ -182,7 +424,7 @@ class TestAutochekScraper:
                 'created_at': '2024-01-15'
             }]
             
-            vehicles = self.scraper.search_vehicles("Toyota", "Corolla", 2015)
+            vehicles = scraper.search_vehicles("Toyota", "Corolla", 2015)
             
             assert len(vehicles) == 1
             assert vehicles[0]['make'] == 'Toyota'
@@ -190,13 +432,90 @@ class TestAutochekScraper:
             assert vehicles[0]['year'] == 2015
             mock_fallback.assert_called_once_with("Toyota", "Corolla", 2015)
     
-    def test_get_text_from_selectors(self):
+    def test_save_to_csv_matches_csv_module(self, scraper, tmp_path):
+        """Test CSV fast path output matches csv.DictWriter, including quoted fields."""
+        vehicles = [
+            {'listing_id': 'a-1', 'make': 'Toyota', 'model': 'Corolla', 'year': 2015,
+             'price': 5500000, 'currency': 'NGN', 'location': 'Lagos'},
+            {'listing_id': 'a-2', 'make': 'Honda', 'model': 'Civic', 'year': 2018,
+             'variant': 'EX, "Sport"', 'location': 'Ikeja\nLagos'}
+        ]
+        output = tmp_path / 'out.csv'
+        scraper.save_to_csv(vehicles, str(output))
+        
+        expected = io.StringIO(newline='')
+        writer = csv.DictWriter(expected, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(vehicles)
+        
+        assert output.read_bytes().decode('utf-8') == expected.getvalue()
+    
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_save_to_json_round_trip(self, scraper, tmp_path, use_orjson):
+        """Test JSON output loads back identically with and without orjson."""
+        if use_orjson and not scraper_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        vehicles = [{'listing_id': 'a-1', 'make': 'Toyota', 'location': 'Lagos', 'price': None, 'currency': '₦'}]
+        output = tmp_path / 'out.json'
+        
+        with patch.object(scraper_module, 'ORJSON_AVAILABLE', use_orjson):
+            scraper.save_to_json(vehicles, str(output))
+        
+        assert json.loads(output.read_text(encoding='utf-8')) == vehicles
+    
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_save_to_ndjson_one_record_per_line(self, scraper, tmp_path, use_orjson):
+        """Test NDJSON output writes one loadable record per line."""
+        if use_orjson and not scraper_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        vehicles = [{'listing_id': 'a-1', 'location': 'Lagos', 'currency': '₦'},
+                    {'listing_id': 'a-2', 'location': 'Ikeja\nLagos', 'currency': 'NGN'}]
+        output = tmp_path / 'out.ndjson'
+        
+        with patch.object(scraper_module, 'ORJSON_AVAILABLE', use_orjson):
+            scraper.save_to_ndjson(vehicles, str(output))
+        
+        lines = output.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line) for line in lines] == vehicles
+    
+    @pytest.mark.parametrize('suffix', ['parquet', 'feather'])
+    def test_save_to_arrow_formats(self, scraper, tmp_path, suffix):
+        """Test Parquet/Feather output round-trips with dictionary-encoded columns."""
+        pyarrow = pytest.importorskip('pyarrow')
+        vehicles = [
+            {'listing_id': 'a-1', 'make': 'Toyota', 'model': 'Corolla', 'year': 2015,
+             'price': 5500000, 'currency': 'NGN', 'location': 'Lagos'},
+            {'listing_id': 'a-2', 'make': 'Toyota', 'model': 'Camry', 'year': 2018,
+             'price': None, 'currency': 'NGN', 'location': 'Abuja'}
+        ]
+        output = tmp_path / f'out.{suffix}'
+        getattr(scraper, f'save_to_{suffix}')(vehicles, str(output))
+        
+        if suffix == 'parquet':
+            import pyarrow.parquet
+            table = pyarrow.parquet.read_table(str(output))
+        else:
+            import pyarrow.feather
+            table = pyarrow.feather.read_table(str(output))
+        
+        assert table.column_names == CSV_FIELDNAMES
+        assert pyarrow.types.is_dictionary(table.schema.field('make').type)
+        assert table.column('price').to_pylist() == [5500000, None]
+    
+    def test_build_listings_url(self, scraper):
+        """Test paginated listing URLs are built and cached."""
+        base = scraper.base_url
+        assert build_listings_url(base) == f"{base}/ng/cars-for-sale"
+        assert build_listings_url(base, 3) == f"{base}/ng/cars-for-sale?page_number=3"
+        assert build_listings_url(base, 3) is build_listings_url(base, 3)
+    
+    def test_get_text_from_selectors(self, scraper):
         """Test text extraction from multiple selectors."""
         # Mock element
-        mock_element = MagicMock()
+        mock_element = AsyncMock()
         
         # Mock successful selector
-        mock_text_elem = MagicMock()
+        mock_text_elem = AsyncMock()
         mock_text_elem.text_content.return_value = "Test Text"
         
         def query_selector_side_effect(selector):
@@ -207,14 +526,142 @@ class TestAutochekScraper:
         mock_element.query_selector.side_effect = query_selector_side_effect
         
         # Test successful extraction
-        result = self.scraper._get_text_from_selectors(mock_element, ['.notfound', '.found'])
+        result = asyncio.run(scraper._get_text_from_selectors(mock_element, ['.notfound', '.found']))
         assert result == "Test Text"
         
         # Test no match
-        result = self.scraper._get_text_from_selectors(mock_element, ['.notfound1', '.notfound2'])
+        result = asyncio.run(scraper._get_text_from_selectors(mock_element, ['.notfound1', '.notfound2']))
         assert result is None
 
 
+class TestRetryableHTTPSession:
+    """Test class for the pooled retry session."""
+    
+    def test_scrapers_share_pooled_session(self):
+        """Test that scraper instances reuse one pooled session."""
+        first = AutochekScraper(rate_limit=0.1)
+        second = AutochekScraper(rate_limit=0.1)
+        
+        assert first.session.session is second.session.session
+        assert first.session.session is retry_utils.get_shared_session()
+        
+        adapter = first.session.session.get_adapter('https://autochek.africa')
+        assert adapter._pool_maxsize == retry_utils.POOL_MAXSIZE
+        assert first.session.session.headers['Connection'] == 'keep-alive'
+        assert 'gzip' in first.session.session.headers['Accept-Encoding']
+    
+    def test_explicit_session_is_used(self):
+        """Test that an explicit session overrides the shared one."""
+        session = create_autospec(requests.Session, instance=True)
+        retryable = RetryableHTTPSession(session=session)
+        assert retryable.session is session
+    
+    def test_adapter_retry_policy(self):
+        """Test that retries are configured on the mounted adapter."""
+        session = retry_utils.get_shared_session(max_retries=5, backoff_factor=0.5)
+        retry = session.get_adapter('https://autochek.africa').max_retries
+        
+        assert retry.total == 5
+        assert retry.backoff_factor == 0.5
+        assert 503 in retry.status_forcelist
+        assert 429 in retry.status_forcelist
+        assert session is not retry_utils.get_shared_session()
+    
+    def test_5xx_raises_after_retries(self):
+        """Test that a final 5xx response raises HTTPError."""
+        response = requests.Response()
+        response.status_code = 503
+        session = create_autospec(requests.Session, instance=True)
+        session.request.return_value = response
+        
+        with pytest.raises(requests.HTTPError):
+            RetryableHTTPSession(session=session).get('https://autochek.africa')
+    
+    def test_connection_failure_raises_retry_error(self):
+        """Test that connection failures surface as HTTPRetryError."""
+        session = create_autospec(requests.Session, instance=True)
+        session.request.side_effect = requests.ConnectionError("refused")
+        
+        with pytest.raises(HTTPRetryError):
+            RetryableHTTPSession(session=session).get('https://autochek.africa')
+    
+    def test_stop_interrupts_backoff(self):
+        """Test that stopping retries cuts a backoff wait short."""
+        retry = retry_utils.build_retry(max_retries=3, backoff_factor=30.0)
+        retry = retry.increment('GET', '/', error=ConnectTimeoutError())
+        retry = retry.increment('GET', '/', error=ConnectTimeoutError())
+        
+        with patch.object(retry_utils, '_STOP_EVENT', retry_utils.threading.Event()) as event:
+            event.set()
+            start = time.monotonic()
+            with pytest.raises(HTTPRetryError):
+                retry.sleep()
+            assert time.monotonic() - start < 1.0
+    
+    def test_reset_retries_reenables_backoff(self):
+        """Test that stopping retries is process-wide until reset_retries() clears it."""
+        retry = retry_utils.build_retry(max_retries=3, backoff_factor=0.0)
+        
+        with patch.object(retry_utils, '_STOP_EVENT', retry_utils.threading.Event()):
+            retry_utils.stop_retries()
+            with pytest.raises(HTTPRetryError):
+                retry._wait(0)
+            
+            retry_utils.reset_retries()
+            retry._wait(0)
+    
+    @pytest.mark.parametrize('status_code,expected_calls', [(404, 1), (503, 3)])
+    def test_retry_on_5xx_skips_client_errors(self, status_code, expected_calls):
+        """Test that the decorator retries 5xx errors but not 4xx errors."""
+        response = requests.Response()
+        response.status_code = status_code
+        failing = Mock(side_effect=requests.HTTPError(response=response))
+        
+        decorated = retry_utils.retry_on_5xx(max_attempts=3, min_wait=0, max_wait=0)(failing)
+        with pytest.raises(requests.HTTPError):
+            decorated()
+        
+        assert failing.call_count == expected_calls
+    
+    def test_fetch_many_preserves_order(self):
+        """Test that concurrent fetches return responses in URL order."""
+        urls = [f'https://autochek.africa/ng/cars-for-sale?page_number={n}' for n in range(1, 6)]
+        session = create_autospec(requests.Session, instance=True)
+        session.request.side_effect = lambda method, url, **kwargs: Mock(status_code=200, url=url)
+        
+        responses = RetryableHTTPSession(session=session).fetch_many(urls, max_workers=3)
+        
+        assert [r.url for r in responses] == urls
+        assert session.request.call_count == len(urls)
+    
+    def test_fetch_many_returns_exceptions(self):
+        """Test that return_exceptions keeps a failed URL from aborting the batch."""
+        urls = [f'https://autochek.africa/ng/cars-for-sale?page_number={n}' for n in range(1, 4)]
+        def request(method, url, **kwargs):
+            if url.endswith('page_number=2'):
+                raise requests.ConnectionError("reset")
+            return Mock(status_code=200, url=url)
+        
+        session = create_autospec(requests.Session, instance=True)
+        session.request.side_effect = request
+        retryable = RetryableHTTPSession(session=session)
+        
+        responses = retryable.fetch_many(urls, max_workers=3, return_exceptions=True)
+        
+        assert responses[0].url == urls[0] and responses[2].url == urls[2]
+        assert isinstance(responses[1], HTTPRetryError)
+        with pytest.raises(HTTPRetryError):
+            retryable.fetch_many(urls, max_workers=3)
+    
+    def test_rate_limiter_spaces_calls(self):
+        """Test that the rate limiter enforces the minimum interval."""
+        limiter = retry_utils.RateLimiter(0.05)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait()
+        assert time.monotonic() - start >= 0.1
+
+
 class TestCLI:
     """Test class for CLI functionality."""
     
@@ -254,8 +701,8 @@ def test_main_function():
     ]
     
     with patch.object(sys, 'argv', test_args):
-        with patch('autochek_scraper.cli.AutochekScraper') as mock_scraper_class:
-            mock_scraper = MagicMock()
+        with patch('autochek_scraper.cli.AutochekScraper', autospec=True) as mock_scraper_class:
+            mock_scraper = mock_scraper_class.return_value
             mock_scraper.search_vehicles.return_value = [{
                 'listing_id': 'test-001',
                 'make': 'Toyota',
@@ -265,7 +712,6 @@ def test_main_function():
                 'currency': 'NGN'
             }]
             mock_scraper.save_to_json.return_value = None
-            mock_scraper_class.return_value = mock_scraper
             
             result = main()
             
@@ -273,5 +719,111 @@ def test_main_function():
             mock_scraper.search_vehicles.assert_called_once_with('Toyota', 'Corolla', 2015)
 
 
-if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
\ No newline at end of file
+def test_main_writes_shared_output_once():
+    """Test that --out and --csv naming the same file write it only once."""
+    test_args = [
+        'scrape_autochek.py',
+        '--make', 'Toyota',
+        '--model', 'Corolla',
+        '--year', '2015',
+        '--out', 'results.csv',
+        '--csv', 'results.csv'
+    ]
+    
+    with patch.object(sys, 'argv', test_args):
+        with patch('autochek_scraper.cli.AutochekScraper', autospec=True) as mock_scraper_class:
+            mock_scraper = mock_scraper_class.return_value
+            mock_scraper.search_vehicles.return_value = []
+            
+            assert main() == 0
+            mock_scraper.save_to_csv.assert_called_once_with([], 'results.csv')
+            mock_scraper.save_to_json.assert_not_called()
+
+
+def test_daemon_reuses_scraper_across_jobs(tmp_path, capsys):
+    """Test daemon mode runs every stdin job with a single scraper."""
+    jobs = io.StringIO(
+        json.dumps({'make': 'Toyota', 'model': 'Corolla', 'year': 2015, 'out': str(tmp_path / 'a.json')}) + '\n'
+        + '\n'
+        + json.dumps({'make': 'Honda', 'model': 'Civic', 'year': '2018', 'out': str(tmp_path / 'b.csv')}) + '\n'
+        + '{"make": "Broken"}\n'
+        + json.dumps({'make': 'Ford', 'model': 'Focus', 'year': 2020, 'out': 'c.txt'}) + '\n'
+    )
+    
+    with patch.object(sys, 'argv', ['scrape_autochek.py', '--daemon']), patch.object(sys, 'stdin', jobs):
+        with patch('autochek_scraper.cli.AutochekScraper', autospec=True) as mock_scraper_class:
+            mock_scraper = mock_scraper_class.return_value
+            mock_scraper.search_vehicles.return_value = []
+            
+            assert main() == 0
+    
+    mock_scraper_class.assert_called_once()
+    assert mock_scraper.search_vehicles.call_args_list == [
+        (('Toyota', 'Corolla', 2015),), (('Honda', 'Civic', 2018),)
+    ]
+    mock_scraper.save_to_csv.assert_called_once_with([], str(tmp_path / 'b.csv'))
+    mock_scraper.close.assert_called_once()
+    
+    statuses = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [s['status'] for s in statuses] == ['ok', 'ok', 'error', 'error']
+
+
+def test_interrupt_stops_retries_before_close():
+    """Test that Ctrl-C stops retries before the scraper is closed."""
+    test_args = ['scrape_autochek.py', '--make', 'Toyota', '--model', 'Corolla', '--year', '2015', '--out', 'a.json']
+    stopped_at_close = []
+    
+    with patch.object(sys, 'argv', test_args), patch('autochek_scraper.cli.stop_retries') as mock_stop:
+        with patch('autochek_scraper.cli.AutochekScraper', autospec=True) as mock_scraper_class:
+            mock_scraper = mock_scraper_class.return_value
+            mock_scraper.search_vehicles.side_effect = KeyboardInterrupt
+            mock_scraper.close.side_effect = lambda: stopped_at_close.append(mock_stop.called)
+            
+            assert main() == 130
+    
+    assert stopped_at_close == [True]
+
+
+def test_missing_required_arguments_rejected():
+    """Test that search arguments are required outside daemon mode."""
+    with pytest.raises(SystemExit) as exc_info:
+        parse_arguments(['--make', 'Toyota'])
+    assert exc_info.value.code == 2
+
+
+def test_unsupported_output_rejected_before_scraping():
+    """Test that an unsupported --out extension exits with 2 before scraping."""
+    test_args = [
+        'scrape_autochek.py',
+        '--make', 'Toyota',
+        '--model', 'Corolla',
+        '--year', '2015',
+        '--out', 'results.txt'
+    ]
+    
+    with patch.object(sys, 'argv', test_args):
+        with patch('autochek_scraper.cli.AutochekScraper', autospec=True) as mock_scraper_class:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+    
+    assert exc_info.value.code == 2
+    mock_scraper_class.assert_not_called()
+
+
+@pytest.mark.parametrize('out', ['results.parquet', 'results.feather'])
+def test_arrow_output_needs_pyarrow_before_scraping(out, capsys):
+    """Test that Parquet/Feather outputs are rejected up front when pyarrow is missing."""
+    test_args = ['scrape_autochek.py', '--make', 'Toyota', '--model', 'Corolla', '--year', '2015', '--out', out]
+    
+    with patch('autochek_scraper.cli.PYARROW_AVAILABLE', False), patch.object(sys, 'argv', test_args):
+        with patch('autochek_scraper.cli.AutochekScraper', autospec=True) as mock_scraper_class:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        
+        # Daemon jobs resolve their outputs through the same check
+        with pytest.raises(ValueError, match='requires pyarrow'):
+            get_output_targets(SimpleNamespace(out=out, csv=None))
+    
+    assert exc_info.value.code == 2
+    assert 'requires pyarrow' in capsys.readouterr().err
+    mock_scraper_class.assert_not_called()